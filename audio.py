@@ -8,39 +8,186 @@ Based on Pollen Robotics documentation and enhanced for better user experience
 import time
 import logging
 import os
-from typing import List, Optional, Dict
-from reachy2_sdk import ReachySDK
+import stat
+import sys
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, List, Optional, Dict
+
+if TYPE_CHECKING:
+    from reachy2_sdk import ReachySDK
 
 logger = logging.getLogger(__name__)
 
+# Upload message size; the SDK notes 64 KiB as the gRPC message limit for audio chunks
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Longest a playback wait blocks when the SDK cannot report that playback ended
+PLAYBACK_WAIT_TIMEOUT = 60.0
+
+_MENU_BANNER = "\n".join([
+    "",
+    "=" * 40,
+    "🎵 REACHY2 AUDIO MANAGER",
+    "=" * 40,
+    "1. List audio files",
+    "2. Upload audio file",
+    "3. Play audio file",
+    "4. Record new audio",
+    "5. Download audio file",
+    "6. Remove audio file",
+    "7. Stop playback/recording",
+    "8. Test recording & playback",
+    "9. Upload directory",
+    "10. Back to main menu",
+])
+_MENU_PROMPT = _MENU_BANNER + "\n\nEnter choice (1-10): "
+
+def _emit(*lines: str):
+    """Write several lines to stdout with a single write and flush"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+def _yes(response: str) -> bool:
+    """True if a y/N prompt response starts with y or Y"""
+    return response[:1] in ('y', 'Y')
+
+def _env_chunk_size() -> int:
+    """Upload chunk size from $REACHY_AUDIO_CHUNK, or the default if unset/invalid"""
+    value = os.environ.get('REACHY_AUDIO_CHUNK')
+    if not value:
+        return UPLOAD_CHUNK_SIZE
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(f"Ignoring invalid REACHY_AUDIO_CHUNK={value!r}")
+        return UPLOAD_CHUNK_SIZE
+
+def wait_for_audio_file(list_files: Callable[[], List[str]], filename: str,
+                        timeout: float = 2.0, interval: float = 0.1) -> bool:
+    """
+    Poll the robot's storage until a file appears
+    
+    Args:
+        list_files: Returns a fresh (uncached) listing of the robot's audio files
+        filename: Name of file to look for
+        timeout: Maximum time to wait in seconds
+        interval: Delay between checks in seconds
+        
+    Returns:
+        bool: True if the file appeared before the timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if filename in list_files():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+def _extension(name: str) -> str:
+    """Lower-cased extension of a file name including the dot, or '' if it has none"""
+    stem, dot, ext = name.rpartition('.')
+    return dot + ext.lower() if stem else ''
+
 class AudioManager:
     """Enhanced audio management for Reachy2 robot"""
     
-    def __init__(self, reachy_sdk: ReachySDK):
+    # Upload formats, and the get_file_info bucket for each extension
+    _SUPPORTED = frozenset({'.wav', '.mp3', '.ogg'})
+    _EXT_BUCKET = {'.wav': 'wav', '.mp3': 'mp3', '.ogg': 'ogg'}
+    
+    def __init__(self, reachy_sdk: "ReachySDK", files_cache_ttl: float = 2.0,
+                 chunk_size: Optional[int] = None, parallelism: int = 4):
         """
         Initialize audio manager
         
         Args:
             reachy_sdk: Connected ReachySDK instance
+            files_cache_ttl: Seconds a fetched file list is reused before re-querying the robot
+            chunk_size: Bytes per upload message (default: $REACHY_AUDIO_CHUNK or 64 KiB).
+                Larger chunks need fewer messages per file, but must stay under the
+                server's gRPC message size limit
+            parallelism: Number of concurrent transfers for upload_many/download_many
         """
         self.reachy = reachy_sdk
-        self.supported_formats = ['.wav', '.mp3', '.ogg']
         self.recording_format = '.ogg'  # Only format supported for recording
+        self.files_cache_ttl = files_cache_ttl
+        self._files_cache: Optional[List[str]] = None
+        self._files_cache_ts = 0.0
+        self._playback_stopped = threading.Event()
+        self._closing = False
+        self.chunk_size = chunk_size or _env_chunk_size()
+        self.parallelism = parallelism
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._pending: List[Future] = []
+        self._status: "queue.Queue[str]" = queue.Queue()
+        self._menu_actions = {
+            '1': self._menu_list_files,
+            '2': self._menu_upload_file,
+            '3': self._menu_play_file,
+            '4': self._menu_record_audio,
+            '5': self._menu_download_file,
+            '6': self._menu_remove_file,
+            '7': self._menu_stop_audio,
+            '8': self._menu_test_audio,
+            '9': self._menu_upload_directory,
+        }
         
-    def list_audio_files(self) -> List[str]:
+    def list_audio_files(self, force_refresh: bool = False) -> List[str]:
         """
         List all audio files stored on the robot
         
+        The list is cached for ``files_cache_ttl`` seconds and dropped whenever
+        this manager changes the robot's storage (upload, record, remove).
+        
+        Args:
+            force_refresh: If True, bypass the cache and query the robot
+            
         Returns:
             List of audio filenames
         """
+        now = time.monotonic()
+        if (not force_refresh and self._files_cache is not None
+                and now - self._files_cache_ts < self.files_cache_ttl):
+            return list(self._files_cache)
+        
         try:
             files = self.reachy.audio.get_audio_files()
-            return files if files else []
+            self._files_cache = list(files) if files else []
+            self._files_cache_ts = now
+            return list(self._files_cache)
         except Exception as e:
             logger.error(f"Failed to list audio files: {e}")
             return []
     
+    def _available_set(self) -> frozenset:
+        """Robot audio file names as a set, for membership checks"""
+        return frozenset(self.list_audio_files())
+    
+    def _require_file(self, filename: str, available: Optional[frozenset] = None) -> bool:
+        """
+        Check that a file exists on the robot, reporting it if not
+        
+        Args:
+            filename: Name of file on robot
+            available: Known robot file names; skips listing files when given
+            
+        Returns:
+            bool: True if the file exists
+        """
+        files = available if available is not None else self._available_set()
+        if filename in files:
+            return True
+        print(f"❌ Audio file not found: {filename}")
+        print(f"Available files: {', '.join(sorted(files)) if files else 'None'}")
+        return False
+    
+    def _invalidate_files_cache(self):
+        """Drop the cached file list so the next lookup queries the robot"""
+        self._files_cache = None
+    
     def upload_audio_file(self, local_path: str) -> bool:
         """
         Upload an audio file to the robot
@@ -52,20 +199,30 @@ class AudioManager:
             bool: True if upload successful
         """
         try:
-            if not os.path.exists(local_path):
+            # One stat call both checks the file and gives its size
+            try:
+                file_stat = os.stat(local_path)
+            except FileNotFoundError:
+                file_stat = None
+            if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
                 print(f"❌ File not found: {local_path}")
                 return False
             
             # Check file format
-            file_ext = os.path.splitext(local_path)[1].lower()
-            if file_ext not in self.supported_formats:
+            name = os.path.basename(local_path)
+            file_ext = _extension(name)
+            if file_ext not in self._SUPPORTED:
                 print(f"❌ Unsupported format: {file_ext}")
-                print(f"Supported formats: {', '.join(self.supported_formats)}")
+                print(f"Supported formats: {', '.join(sorted(self._SUPPORTED))}")
                 return False
             
-            print(f"📤 Uploading {os.path.basename(local_path)}...")
-            self.reachy.audio.upload_audio_file(local_path)
-            print(f"✅ Upload completed: {os.path.basename(local_path)}")
+            print(f"📤 Uploading {name} ({file_stat.st_size / 1024:.1f} KB)...")
+            uploaded = self._upload_audio_file_chunked(local_path)
+            self._invalidate_files_cache()
+            if not uploaded:
+                print(f"❌ Upload rejected by robot: {name}")
+                return False
+            print(f"✅ Upload completed: {name}")
             return True
             
         except Exception as e:
@@ -73,35 +230,101 @@ class AudioManager:
             print(f"❌ Upload failed: {e}")
             return False
     
-    def play_audio_file(self, filename: str, wait_for_completion: bool = False) -> bool:
+    def _upload_audio_file_chunked(self, local_path: str,
+                                   chunk_size: Optional[int] = None) -> bool:
+        """
+        Stream a file to the robot, reading the next chunk while the current one is sent
+        
+        A reader thread fills a two-slot queue from disk while the gRPC call
+        drains it, so disk reads overlap network sends. Falls back to the
+        SDK's own upload when its audio stub is not available.
+        
+        Args:
+            local_path: Path to local audio file
+            chunk_size: Bytes per upload message (default: self.chunk_size)
+            
+        Returns:
+            bool: True if the robot accepted the file
+        """
+        stub = getattr(self.reachy.audio, '_audio_stub', None)
+        if stub is None:
+            self.reachy.audio.upload_audio_file(local_path)
+            return True
+        
+        from reachy2_sdk_api.audio_pb2 import AudioFile, AudioFileRequest
+        
+        chunk_size = chunk_size or self.chunk_size
+        chunks = queue.Queue(maxsize=2)
+        stop = threading.Event()
+        
+        def put(item) -> bool:
+            # Give up once the consumer has stopped draining the queue
+            while not stop.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+        
+        def read_chunks():
+            try:
+                with open(local_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(chunk_size), b''):
+                        if not put(chunk):
+                            return
+                put(None)
+            except OSError as e:
+                put(e)
+        
+        def requests():
+            yield AudioFileRequest(info=AudioFile(path=os.path.basename(local_path)))
+            while True:
+                item = chunks.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield AudioFileRequest(chunk_data=item)
+        
+        reader = threading.Thread(target=read_chunks, daemon=True)
+        reader.start()
+        try:
+            response = stub.UploadAudioFile(requests())
+        finally:
+            stop.set()
+            reader.join()
+        if not response.success.value:
+            logger.error(f"Robot rejected upload of {local_path}: {response.error}")
+            return False
+        return True
+    
+    def play_audio_file(self, filename: str, wait_for_completion: bool = False,
+                        available: Optional[frozenset] = None) -> bool:
         """
         Play an audio file stored on the robot
         
         Args:
             filename: Name of audio file to play
             wait_for_completion: If True, wait for playback to complete
+            available: Known robot file names; skips listing files when given
             
         Returns:
             bool: True if playback started successfully
         """
         try:
-            # Check if file exists
-            available_files = self.list_audio_files()
-            if filename not in available_files:
-                print(f"❌ Audio file not found: {filename}")
-                print(f"Available files: {', '.join(available_files) if available_files else 'None'}")
+            if not self._require_file(filename, available):
                 return False
             
-            print(f"🔊 Playing: {filename}")
+            self._say(f"🔊 Playing: {filename}")
+            self._playback_stopped.clear()
             self.reachy.audio.play_audio_file(filename)
             
             if wait_for_completion:
-                print("Waiting for playback to complete...")
-                print("Press Ctrl+C to stop playback early")
+                if threading.current_thread() is threading.main_thread():
+                    self._say("Waiting for playback to complete...", "Press Ctrl+C to stop playback early")
                 try:
-                    # Wait for user to stop or natural completion
-                    while True:
-                        time.sleep(0.5)
+                    self._wait_for_playback()
                 except KeyboardInterrupt:
                     print("\n⏹️ Stopping playback...")
                     self.stop_playback()
@@ -110,9 +333,101 @@ class AudioManager:
             
         except Exception as e:
             logger.error(f"Failed to play audio file: {e}")
-            print(f"❌ Playback failed: {e}")
+            self._say(f"❌ Playback failed: {e}")
             return False
     
+    def _wait_for_playback(self, timeout: float = PLAYBACK_WAIT_TIMEOUT,
+                           max_backoff: float = 0.5):
+        """
+        Block until playback is stopped or finishes, or the timeout expires
+        
+        Wakes on stop_playback() via an event, and gives up once close() has
+        been called. If the SDK exposes an is_playing() query it is polled with
+        a backoff growing from 50ms to max_backoff so natural completion is
+        noticed quickly without spinning; without it the wait lasts until the
+        timeout.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            max_backoff: Longest interval between playback status checks
+        """
+        is_playing = getattr(self.reachy.audio, 'is_playing', None)
+        deadline = time.monotonic() + timeout
+        backoff = 0.05
+        while not self._playback_stopped.wait(timeout=backoff) and not self._closing:
+            if is_playing is not None and not is_playing():
+                break
+            if time.monotonic() >= deadline:
+                break
+            backoff = min(backoff * 2, max_backoff)
+    
+    def play_async(self, filename: str, wait_for_completion: bool = False) -> Future:
+        """
+        Play an audio file on a background thread
+        
+        Args:
+            filename: Name of audio file to play
+            wait_for_completion: If True, the worker waits until playback ends or is stopped
+            
+        Returns:
+            Future resolving to the play_audio_file result
+        """
+        return self._submit(self.play_audio_file, filename, wait_for_completion)
+    
+    def record_async(self, filename: str, duration_secs: int = 5,
+                     countdown: bool = True) -> Future:
+        """
+        Record audio on a background thread
+        
+        Args:
+            filename: Name for recorded file (will add .ogg if missing)
+            duration_secs: Recording duration in seconds
+            countdown: If True, show countdown before recording
+            
+        Returns:
+            Future resolving to the record_audio result
+        """
+        return self._submit(self.record_audio, filename, duration_secs, countdown)
+    
+    def _submit(self, fn, *args) -> Future:
+        """Run fn on the background executor and track it until it finishes"""
+        self._pending = [future for future in self._pending if not future.done()]
+        future = self._executor.submit(fn, *args)
+        self._pending.append(future)
+        return future
+    
+    def _say(self, *lines: str):
+        """Print status lines, or queue them for the menu if called from a worker thread"""
+        if threading.current_thread() is threading.main_thread():
+            _emit(*lines)
+        else:
+            for line in lines:
+                self._status.put(line)
+    
+    def _flush_status(self):
+        """Print status lines queued by background operations"""
+        lines = []
+        while True:
+            try:
+                lines.append(self._status.get_nowait())
+            except queue.Empty:
+                break
+        if lines:
+            _emit(*lines)
+    
+    def cancel_pending(self):
+        """Cancel background operations that have not started yet"""
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+    
+    def close(self):
+        """Cancel queued background operations, release waiting workers and join them"""
+        self._closing = True
+        self.cancel_pending()
+        self._playback_stopped.set()
+        self._executor.shutdown(wait=True)
+    
     def stop_playback(self) -> bool:
         """
         Stop current audio playback
@@ -122,6 +437,7 @@ class AudioManager:
         """
         try:
             self.reachy.audio.stop_playing()
+            self._playback_stopped.set()
             print("⏹️ Playback stopped")
             return True
         except Exception as e:
@@ -142,39 +458,74 @@ class AudioManager:
         Returns:
             bool: True if recording successful
         """
-        try:
-            # Ensure .ogg extension
-            if not filename.endswith('.ogg'):
-                filename += '.ogg'
+        filename = self._recording_name(filename)
+        if not self._start_recording(filename, duration_secs, countdown):
+            return False
+        return self._finish_recording(filename, duration_secs)
+    
+    def _recording_name(self, filename: str) -> str:
+        """Recording file name with the .ogg extension added if missing"""
+        if not filename.endswith(self.recording_format):
+            filename += self.recording_format
+        return filename
+    
+    def _start_recording(self, filename: str, duration_secs: int, countdown: bool) -> bool:
+        """
+        Show the countdown and start a recording on the robot
+        
+        Args:
+            filename: Name for recorded file, including extension
+            duration_secs: Recording duration in seconds
+            countdown: If True, show countdown before recording
             
+        Returns:
+            bool: True if the robot started recording
+        """
+        try:
             if countdown and duration_secs > 3:
-                print("🎙️ Preparing to record...")
+                self._say("🎙️ Preparing to record...")
                 for i in range(3, 0, -1):
-                    print(f"Starting in {i}...")
+                    self._say(f"Starting in {i}...")
                     time.sleep(1)
             
-            print(f"🔴 Recording '{filename}' for {duration_secs} seconds...")
-            print("Speak now!")
-            
+            self._say(f"🔴 Recording '{filename}' for {duration_secs} seconds...", "Speak now!")
             self.reachy.audio.record_audio(filename, duration_secs=duration_secs)
+            return True
             
-            # Wait for recording to complete plus buffer
-            time.sleep(duration_secs + 1)
+        except Exception as e:
+            logger.error(f"Failed to record audio: {e}")
+            self._say(f"❌ Recording failed: {e}")
+            return False
+    
+    def _finish_recording(self, filename: str, duration_secs: int) -> bool:
+        """
+        Wait out a started recording and confirm the robot saved it
+        
+        Args:
+            filename: Name of the recorded file, including extension
+            duration_secs: Recording duration in seconds
+            
+        Returns:
+            bool: True if the file was found in robot storage
+        """
+        try:
+            # Wait for recording to complete
+            time.sleep(duration_secs)
+            self._invalidate_files_cache()
             
-            print(f"✅ Recording completed: {filename}")
+            self._say(f"✅ Recording completed: {filename}")
             
-            # Verify file was created
-            files = self.list_audio_files()
-            if filename in files:
-                print(f"✅ File confirmed in robot storage")
+            # Verify file was created, allowing the robot a moment to save it
+            if wait_for_audio_file(lambda: self.list_audio_files(force_refresh=True), filename):
+                self._say(f"✅ File confirmed in robot storage")
                 return True
             else:
-                print(f"⚠️ File may not have been saved properly")
+                self._say(f"⚠️ File may not have been saved properly")
                 return False
             
         except Exception as e:
             logger.error(f"Failed to record audio: {e}")
-            print(f"❌ Recording failed: {e}")
+            self._say(f"❌ Recording failed: {e}")
             return False
     
     def stop_recording(self) -> bool:
@@ -186,6 +537,7 @@ class AudioManager:
         """
         try:
             self.reachy.audio.stop_recording()
+            self._invalidate_files_cache()
             print("⏹️ Recording stopped")
             return True
         except Exception as e:
@@ -205,17 +557,14 @@ class AudioManager:
             bool: True if download successful
         """
         try:
-            # Check if file exists on robot
-            available_files = self.list_audio_files()
-            if filename not in available_files:
-                print(f"❌ File not found on robot: {filename}")
+            if not self._require_file(filename):
                 return False
             
             print(f"📥 Downloading {filename}...")
-            self.reachy.audio.download_audio_file(filename, local_path)
+            full_path = os.path.join(local_path, filename)
+            self._download_audio_file_streamed(filename, local_path)
             
             # Verify local file was created
-            full_path = os.path.join(local_path, filename)
             if os.path.exists(full_path):
                 print(f"✅ Downloaded to: {full_path}")
                 return True
@@ -228,31 +577,100 @@ class AudioManager:
             print(f"❌ Download failed: {e}")
             return False
     
-    def remove_audio_file(self, filename: str, confirm: bool = True) -> bool:
+    def _download_audio_file_streamed(self, filename: str, local_path: str) -> bool:
+        """
+        Write a robot audio file to disk chunk by chunk as it arrives
+        
+        The SDK's download collects the whole file in memory before writing
+        it out; streaming keeps memory use to a single chunk. Falls back to
+        the SDK's download when its audio stub is not available.
+        
+        Args:
+            filename: Name of file on robot
+            local_path: Local directory to save file in
+            
+        Returns:
+            bool: True if the robot sent the file
+        """
+        stub = getattr(self.reachy.audio, '_audio_stub', None)
+        if stub is None:
+            return self.reachy.audio.download_audio_file(filename, local_path)
+        
+        from reachy2_sdk_api.audio_pb2 import AudioFile
+        
+        full_path = os.path.join(local_path, filename)
+        received = False
+        try:
+            with open(full_path, 'wb') as f:
+                for response in stub.DownloadAudioFile(AudioFile(path=filename)):
+                    kind = response.WhichOneof('data')
+                    if kind == 'info':
+                        received = True
+                    elif kind == 'chunk_data':
+                        f.write(response.chunk_data)
+        except Exception:
+            # Don't leave a truncated file behind
+            if os.path.exists(full_path):
+                os.remove(full_path)
+            raise
+        
+        if not received:
+            os.remove(full_path)
+        return received
+    
+    def upload_many(self, local_paths: List[str]) -> List[bool]:
+        """
+        Upload several audio files concurrently
+        
+        Args:
+            local_paths: Paths to local audio files
+            
+        Returns:
+            List of upload results, in the same order as local_paths
+        """
+        with ThreadPoolExecutor(max_workers=self.parallelism) as executor:
+            return list(executor.map(self.upload_audio_file, local_paths))
+    
+    def download_many(self, filenames: List[str], local_path: str) -> List[bool]:
+        """
+        Download several audio files from the robot concurrently
+        
+        Args:
+            filenames: Names of files on robot
+            local_path: Local directory to save files in
+            
+        Returns:
+            List of download results, in the same order as filenames
+        """
+        with ThreadPoolExecutor(max_workers=self.parallelism) as executor:
+            return list(executor.map(
+                lambda filename: self.download_audio_file(filename, local_path), filenames))
+    
+    def remove_audio_file(self, filename: str, confirm: bool = True,
+                          available: Optional[frozenset] = None) -> bool:
         """
         Remove an audio file from the robot
         
         Args:
             filename: Name of file to remove
             confirm: If True, ask for confirmation
+            available: Known robot file names; skips listing files when given
             
         Returns:
             bool: True if removal successful
         """
         try:
-            # Check if file exists
-            available_files = self.list_audio_files()
-            if filename not in available_files:
-                print(f"❌ File not found: {filename}")
+            if not self._require_file(filename, available):
                 return False
             
             if confirm:
                 response = input(f"Are you sure you want to delete '{filename}'? (y/N): ")
-                if not response.lower().startswith('y'):
+                if not _yes(response):
                     print("Delete cancelled")
                     return False
             
             self.reachy.audio.remove_audio_file(filename)
+            self._invalidate_files_cache()
             print(f"🗑️ Removed: {filename}")
             return True
             
@@ -277,78 +695,46 @@ class AudioManager:
         }
         
         for file in files:
-            ext = os.path.splitext(file)[1].lower()
-            if ext == '.wav':
-                info['wav'].append(file)
-            elif ext == '.mp3':
-                info['mp3'].append(file)
-            elif ext == '.ogg':
-                info['ogg'].append(file)
-            else:
-                info['other'].append(file)
+            info[self._EXT_BUCKET.get(_extension(file), 'other')].append(file)
         
         return info
     
     def interactive_audio_menu(self):
         """Interactive audio management menu"""
         while True:
-            print("\n" + "=" * 40)
-            print("🎵 REACHY2 AUDIO MANAGER")
-            print("=" * 40)
-            print("1. List audio files")
-            print("2. Upload audio file")
-            print("3. Play audio file")
-            print("4. Record new audio")
-            print("5. Download audio file")
-            print("6. Remove audio file")
-            print("7. Stop playback/recording")
-            print("8. Test recording & playback")
-            print("9. Back to main menu")
-            
-            choice = input("\nEnter choice (1-9): ").strip()
+            self._flush_status()
+            choice = input(_MENU_PROMPT).strip()
+            self._flush_status()
             
             try:
-                if choice == '1':
-                    self._menu_list_files()
-                elif choice == '2':
-                    self._menu_upload_file()
-                elif choice == '3':
-                    self._menu_play_file()
-                elif choice == '4':
-                    self._menu_record_audio()
-                elif choice == '5':
-                    self._menu_download_file()
-                elif choice == '6':
-                    self._menu_remove_file()
-                elif choice == '7':
-                    self._menu_stop_audio()
-                elif choice == '8':
-                    self._menu_test_audio()
-                elif choice == '9':
+                action = self._menu_actions.get(choice)
+                if action:
+                    action()
+                elif choice == '10':
                     break
                 else:
-                    print("Invalid choice. Please enter 1-9.")
+                    print("Invalid choice. Please enter 1-10.")
                     
             except Exception as e:
                 print(f"❌ Error: {e}")
     
     def _menu_list_files(self):
         """Menu option: List files"""
-        print("\n📋 Audio Files on Robot:")
+        lines = ["\n📋 Audio Files on Robot:"]
         info = self.get_file_info()
         
         total_files = sum(len(files) for files in info.values())
         if total_files == 0:
-            print("No audio files found")
+            _emit(*lines, "No audio files found")
             return
         
         for file_type, files in info.items():
             if files:
-                print(f"\n{file_type.upper()} files:")
-                for i, file in enumerate(files, 1):
-                    print(f"  {i}. {file}")
+                lines.append(f"\n{file_type.upper()} files:")
+                lines.extend(f"  {i}. {file}" for i, file in enumerate(files, 1))
         
-        print(f"\nTotal: {total_files} files")
+        lines.append(f"\nTotal: {total_files} files")
+        _emit(*lines)
     
     def _menu_upload_file(self):
         """Menu option: Upload file"""
@@ -356,6 +742,24 @@ class AudioManager:
         if file_path:
             self.upload_audio_file(file_path)
     
+    def _menu_upload_directory(self):
+        """Menu option: Upload every supported audio file in a directory"""
+        directory = input("Enter directory containing audio files: ").strip()
+        if not directory:
+            return
+        if not os.path.isdir(directory):
+            print(f"❌ Directory not found: {directory}")
+            return
+        
+        paths = [os.path.join(directory, name) for name in sorted(os.listdir(directory))
+                 if _extension(name) in self._SUPPORTED]
+        if not paths:
+            print("No supported audio files found")
+            return
+        
+        results = self.upload_many(paths)
+        print(f"\nUploaded {sum(results)}/{len(paths)} files")
+    
     def _menu_play_file(self):
         """Menu option: Play file"""
         files = self.list_audio_files()
@@ -363,9 +767,7 @@ class AudioManager:
             print("No audio files available")
             return
         
-        print("\nAvailable files:")
-        for i, file in enumerate(files, 1):
-            print(f"{i}. {file}")
+        _emit("\nAvailable files:", *(f"{i}. {file}" for i, file in enumerate(files, 1)))
         
         choice = input("Enter filename or number: ").strip()
         
@@ -380,8 +782,8 @@ class AudioManager:
         except ValueError:
             filename = choice
         
-        wait = input("Wait for completion? (y/N): ").strip().lower()
-        self.play_audio_file(filename, wait_for_completion=wait.startswith('y'))
+        # Starting playback is a single quick call; option 7 stops it
+        self.play_audio_file(filename)
     
     def _menu_record_audio(self):
         """Menu option: Record audio"""
@@ -396,7 +798,11 @@ class AudioManager:
         except ValueError:
             duration = 5
         
-        self.record_audio(filename, duration)
+        # Count down and start on the main thread so the prompts stay readable;
+        # only the wait for the recording to finish runs in the background
+        filename = self._recording_name(filename)
+        if self._start_recording(filename, duration, countdown=True):
+            self._submit(self._finish_recording, filename, duration)
     
     def _menu_download_file(self):
         """Menu option: Download file"""
@@ -405,9 +811,7 @@ class AudioManager:
             print("No audio files available")
             return
         
-        print("\nAvailable files:")
-        for i, file in enumerate(files, 1):
-            print(f"{i}. {file}")
+        _emit("\nAvailable files:", *(f"{i}. {file}" for i, file in enumerate(files, 1)))
         
         filename = input("Enter filename to download: ").strip()
         local_path = input("Enter local directory path (default: C:/): ").strip()
@@ -424,9 +828,7 @@ class AudioManager:
             print("No audio files available")
             return
         
-        print("\nAvailable files:")
-        for i, file in enumerate(files, 1):
-            print(f"{i}. {file}")
+        _emit("\nAvailable files:", *(f"{i}. {file}" for i, file in enumerate(files, 1)))
         
         filename = input("Enter filename to remove: ").strip()
         self.remove_audio_file(filename)
@@ -434,6 +836,7 @@ class AudioManager:
     def _menu_stop_audio(self):
         """Menu option: Stop audio"""
         print("Stopping all audio operations...")
+        self.cancel_pending()
         self.stop_playback()
         self.stop_recording()
     
@@ -444,12 +847,15 @@ class AudioManager:
         
         print("Step 1: Recording 3-second test...")
         if self.record_audio(test_filename, 3):
+            # record_audio just confirmed the file, so this list comes from the cache
+            available = self._available_set()
             print("Step 2: Playing back recording...")
             time.sleep(1)
-            if self.play_audio_file(test_filename + ".ogg"):
+            if self.play_audio_file(test_filename + ".ogg", available=available):
                 time.sleep(4)  # Let it play
                 print("Step 3: Cleaning up...")
-                self.remove_audio_file(test_filename + ".ogg", confirm=False)
+                self.remove_audio_file(test_filename + ".ogg", confirm=False,
+                                       available=available)
                 print("✅ Audio test completed!")
             else:
                 print("❌ Playback test failed")
@@ -461,12 +867,16 @@ def demo_audio_system(controller):
     print("\n🎵 Reachy2 Audio System")
     print("Enhanced audio recording and playback")
     
+    audio_manager = None
     try:
         audio_manager = AudioManager(controller.reachy)
         audio_manager.interactive_audio_menu()
         
     except Exception as e:
         print(f"❌ Audio system error: {e}")
+    finally:
+        if audio_manager is not None:
+            audio_manager.close()
 
 if __name__ == "__main__":
     # Standalone testing
@@ -5,16 +5,322 @@ Creates visual scenes in Gazebo simulation using SDF spawning
 """
 
 import time
+import json
+import queue
+import shlex
 import logging
+import threading
+import uuid
 import subprocess
-from typing import Dict, List, Tuple
+import numpy as np
+from functools import lru_cache
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Optional, Sequence, Tuple
 from reachy2_sdk import ReachySDK
 
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True)
+class SceneObject:
+    """A static object placed in a Gazebo scene"""
+    __slots__ = ("name", "type", "position", "size", "color")
+    
+    name: str
+    type: str
+    position: Tuple[float, float, float]
+    size: Tuple[float, float, float]
+    color: str
+
+# Approach point relative to a target: 10 cm back and 10 cm above
+APPROACH_OFFSET = np.array([-0.1, 0.0, 0.1])
+
+# (name, SDF XML, position) for one object, ready to spawn
+SpawnEntry = Tuple[str, str, Tuple[float, float, float]]
+
+# Scene definitions never change, so their SDFs are built once at import
+# time (see _PREBUILT_SDFS below the class)
+FRUITS_OBJECTS = (
+    SceneObject(
+        name="table_fruits",
+        type="box", 
+        position=(0.7, 0, 0.28),
+        size=(0.45, 0.34, 0.28),
+        color="brown"
+    ),
+    SceneObject(
+        name="apple1",
+        type="sphere",
+        position=(0.5, -0.12, 0.63),
+        size=(0.04, 0.04, 0.04),
+        color="red"
+    ),
+    SceneObject(
+        name="apple2", 
+        type="sphere",
+        position=(0.58, -0.07, 0.63),
+        size=(0.04, 0.04, 0.04),
+        color="red"
+    ),
+    SceneObject(
+        name="orange1",
+        type="sphere", 
+        position=(0.5, 0.15, 0.63),
+        size=(0.04, 0.04, 0.04),
+        color="orange"
+    ),
+    SceneObject(
+        name="orange2",
+        type="sphere",
+        position=(0.56, 0.07, 0.63), 
+        size=(0.04, 0.04, 0.04),
+        color="orange"
+    ),
+    SceneObject(
+        name="plate",
+        type="cylinder",
+        position=(0.6, 0.3, 0.65),
+        size=(0.08, 0.08, 0.01),
+        color="white"
+    ),
+    SceneObject(
+        name="bowl",
+        type="cylinder", 
+        position=(0.65, -0.25, 0.64),
+        size=(0.06, 0.06, 0.03),
+        color="blue"
+    ),
+)
+
+TABLE_OBJECTS = (
+    SceneObject(
+        name="table_main",
+        type="box",
+        position=(0.7, 0, 0.35),
+        size=(0.8, 1.2, 0.7),
+        color="wood_brown"
+    ),
+    SceneObject(
+        name="goal_box", 
+        type="box",
+        position=(0.45, -0.4, 0.75),  # Placed on table
+        size=(0.025, 0.025, 0.025),
+        color="red"
+    ),
+)
+
+KITCHEN_OBJECTS = (
+    SceneObject(
+        name="counter",
+        type="box",
+        position=(1.0, 0, 0.4),
+        size=(0.6, 1.5, 0.8),
+        color="marble_white"
+    ),
+    SceneObject(
+        name="cutting_board",
+        type="box", 
+        position=(0.8, 0, 0.82),
+        size=(0.3, 0.2, 0.02),
+        color="wood_brown"
+    ),
+    SceneObject(
+        name="knife",
+        type="box",
+        position=(0.8, 0.1, 0.83),
+        size=(0.15, 0.02, 0.01),
+        color="silver"
+    ),
+    SceneObject(
+        name="pan",
+        type="cylinder",
+        position=(1.2, -0.3, 0.82),
+        size=(0.12, 0.12, 0.03),
+        color="black"
+    ),
+)
+
+ROS_SETUP = "/opt/ros/humble/setup.bash"
+SCENE_DAEMON_PATH = "/tmp/scene_daemon.py"
+
+# Long-lived ROS2 node run inside the container. It reads one JSON command
+# per line on stdin and answers each with one JSON line on stdout.
+SCENE_DAEMON_SCRIPT = """
+import json
+import sys
+import time
+import rclpy
+from rclpy.node import Node
+from gazebo_msgs.srv import SpawnEntity, DeleteEntity
+from geometry_msgs.msg import Pose
+
+rclpy.init()
+node = Node('reachy2_scene_daemon')
+spawn_client = node.create_client(SpawnEntity, '/spawn_entity')
+delete_client = node.create_client(DeleteEntity, '/delete_entity')
+
+def call_all(client, requests, timeout=10.0):
+    # Send every request before waiting, then spin until all have answered
+    if not client.wait_for_service(timeout_sec=5.0):
+        print("Service not available", file=sys.stderr)
+        return [False] * len(requests)
+    futures = [client.call_async(request) for request in requests]
+    deadline = time.monotonic() + timeout
+    while not all(f.done() for f in futures) and time.monotonic() < deadline:
+        rclpy.spin_once(node, timeout_sec=0.01)
+    return [bool(f.done() and f.result() is not None and f.result().success)
+            for f in futures]
+
+def spawn_request(cmd):
+    request = SpawnEntity.Request()
+    request.name = cmd['name']
+    request.xml = cmd['xml']
+    request.robot_namespace = ''
+    request.initial_pose = Pose()
+    request.initial_pose.position.x = float(cmd['pose'][0])
+    request.initial_pose.position.y = float(cmd['pose'][1])
+    request.initial_pose.position.z = float(cmd['pose'][2])
+    request.initial_pose.orientation.w = 1.0
+    request.reference_frame = 'world'
+    return request
+
+def delete_request(name):
+    request = DeleteEntity.Request()
+    request.name = name
+    return request
+
+def spawn_batch(cmd):
+    names = [obj['name'] for obj in cmd['objects']]
+    requests = [spawn_request(obj) for obj in cmd['objects']]
+    return dict(zip(names, call_all(spawn_client, requests)))
+
+def delete_batch(cmd):
+    requests = [delete_request(name) for name in cmd['names']]
+    return dict(zip(cmd['names'], call_all(delete_client, requests)))
+
+OPS = {
+    'spawn_batch': lambda cmd: {'results': spawn_batch(cmd)},
+    'delete_batch': lambda cmd: {'results': delete_batch(cmd)},
+}
+
+print(json.dumps({'ready': True}), flush=True)
+for line in sys.stdin:
+    cmd = json.loads(line)
+    try:
+        reply = OPS[cmd['op']](cmd)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        reply = {'success': False, 'results': {}}
+    print(json.dumps(reply), flush=True)
+
+node.destroy_node()
+rclpy.shutdown()
+"""
+
+# Scripts piped into the container's python3, filled in with format_map.
+# Literal braces in the scripts are doubled.
+SPAWN_BATCH_SCRIPT_TEMPLATE = """
+import json
+import sys
+import time
+import rclpy
+from rclpy.node import Node
+from gazebo_msgs.srv import SpawnEntity
+from geometry_msgs.msg import Pose
+
+objects = json.loads({payload!r})
+
+rclpy.init()
+node = Node('spawn_scene_objects')
+client = node.create_client(SpawnEntity, '/spawn_entity')
+results = {{}}
+
+if client.wait_for_service(timeout_sec=5.0):
+    futures = []
+    for obj in objects:
+        request = SpawnEntity.Request()
+        request.name = obj['name']
+        request.xml = obj['xml']
+        request.robot_namespace = ''
+        request.initial_pose = Pose()
+        request.initial_pose.position.x = obj['position'][0]
+        request.initial_pose.position.y = obj['position'][1]
+        request.initial_pose.position.z = obj['position'][2]
+        request.initial_pose.orientation.w = 1.0
+        request.reference_frame = 'world'
+        futures.append((obj['name'], client.call_async(request)))
+    
+    deadline = time.monotonic() + 10.0
+    while not all(f.done() for _, f in futures) and time.monotonic() < deadline:
+        rclpy.spin_once(node, timeout_sec=0.01)
+    
+    for name, future in futures:
+        response = future.result() if future.done() else None
+        results[name] = bool(response is not None and response.success)
+else:
+    print("Service not available", file=sys.stderr)
+
+node.destroy_node()
+rclpy.shutdown()
+print(json.dumps(results))
+"""
+
+DELETE_BATCH_SCRIPT_TEMPLATE = """
+import json
+import sys
+import time
+import rclpy
+from rclpy.node import Node
+from gazebo_msgs.srv import DeleteEntity
+
+names = json.loads({payload!r})
+
+rclpy.init()
+node = Node('delete_scene_objects')
+client = node.create_client(DeleteEntity, '/delete_entity')
+results = {{}}
+
+if client.wait_for_service(timeout_sec=5.0):
+    futures = []
+    for name in names:
+        request = DeleteEntity.Request()
+        request.name = name
+        futures.append((name, client.call_async(request)))
+    
+    deadline = time.monotonic() + 10.0
+    while not all(f.done() for _, f in futures) and time.monotonic() < deadline:
+        rclpy.spin_once(node, timeout_sec=0.01)
+    
+    for name, future in futures:
+        response = future.result() if future.done() else None
+        results[name] = bool(response is not None and response.success)
+else:
+    print("Service not available", file=sys.stderr)
+
+node.destroy_node()
+rclpy.shutdown()
+print(json.dumps(results))
+"""
+
 class GazeboSceneManager:
     """Manages Gazebo visual scenes for Reachy2"""
     
+    # Gazebo RGBA strings by color name
+    _COLORS = MappingProxyType({
+        "red": "1 0 0 1",
+        "orange": "1 0.5 0 1", 
+        "yellow": "1 1 0 1",
+        "green": "0 1 0 1",
+        "blue": "0 0 1 1",
+        "white": "1 1 1 1",
+        "black": "0 0 0 1",
+        "brown": "0.6 0.3 0.1 1",
+        "wood_brown": "0.8 0.5 0.2 1",
+        "marble_white": "0.95 0.95 0.95 1",
+        "silver": "0.7 0.7 0.7 1",
+        "checker_gray": "0.5 0.5 0.5 1"
+    })
+    
     def __init__(self, reachy_sdk: ReachySDK, docker_name: str = "reachy2_mujoco"):
         """
         Initialize Gazebo scene manager
@@ -28,6 +334,20 @@ class GazeboSceneManager:
         self.spawned_objects = []
         self.docker_name = docker_name
         
+        # argv prefixes shared by every docker exec into the container
+        self._docker_prefix = ("docker", "exec", "-i", docker_name)
+        self._docker_sh_prefix = self._docker_prefix + ("bash", "-c")
+        
+        # Persistent ROS2 node in the container, started on first use
+        self._daemon = None
+        self._daemon_replies = None
+        self._daemon_failed = False
+        
+        # Persistent bash in the container for one-shot commands
+        self._shell = None
+        self._shell_output = None
+        self._shell_failed = False
+        
     def create_fruits_scene(self) -> bool:
         """
         Create fruits scene with apples, oranges, table, plate, bowl in Gazebo
@@ -38,76 +358,18 @@ class GazeboSceneManager:
         try:
             logger.info("Creating fruits scene in Gazebo...")
             
-            scene_objects = [
-                {
-                    "name": "table_fruits",
-                    "type": "box", 
-                    "position": (0.7, 0, 0.28),
-                    "size": (0.45, 0.34, 0.28),
-                    "color": "brown"
-                },
-                {
-                    "name": "apple1",
-                    "type": "sphere",
-                    "position": (0.5, -0.12, 0.63),
-                    "size": (0.04, 0.04, 0.04),
-                    "color": "red"
-                },
-                {
-                    "name": "apple2", 
-                    "type": "sphere",
-                    "position": (0.58, -0.07, 0.63),
-                    "size": (0.04, 0.04, 0.04),
-                    "color": "red"
-                },
-                {
-                    "name": "orange1",
-                    "type": "sphere", 
-                    "position": (0.5, 0.15, 0.63),
-                    "size": (0.04, 0.04, 0.04),
-                    "color": "orange"
-                },
-                {
-                    "name": "orange2",
-                    "type": "sphere",
-                    "position": (0.56, 0.07, 0.63), 
-                    "size": (0.04, 0.04, 0.04),
-                    "color": "orange"
-                },
-                {
-                    "name": "plate",
-                    "type": "cylinder",
-                    "position": (0.6, 0.3, 0.65),
-                    "size": (0.08, 0.08, 0.01),
-                    "color": "white"
-                },
-                {
-                    "name": "bowl",
-                    "type": "cylinder", 
-                    "position": (0.65, -0.25, 0.64),
-                    "size": (0.06, 0.06, 0.03),
-                    "color": "blue"
-                }
-            ]
-            
             scene_description = {
                 "name": "fruits_scene",
-                "objects": scene_objects
+                "objects": FRUITS_OBJECTS
             }
             
             self.current_scene = scene_description
             self._display_scene_info(scene_description)
             
             # Spawn objects in Gazebo
-            success_count = 0
-            for obj in scene_objects:
-                if self._spawn_object_in_gazebo(obj):
-                    success_count += 1
-                    self.spawned_objects.append(obj['name'])
-                else:
-                    print(f"Failed to spawn {obj['name']}")
+            success_count = self._spawn_objects(_PREBUILT_SDFS['fruits_scene'])
             
-            print(f"Successfully spawned {success_count}/{len(scene_objects)} objects in Gazebo")
+            print(f"Successfully spawned {success_count}/{len(FRUITS_OBJECTS)} objects in Gazebo")
             logger.info("Fruits scene created successfully!")
             return success_count > 0
             
@@ -125,41 +387,18 @@ class GazeboSceneManager:
         try:
             logger.info("Creating table scene in Gazebo...")
             
-            scene_objects = [
-                {
-                    "name": "table_main",
-                    "type": "box",
-                    "position": (0.7, 0, 0.35),
-                    "size": (0.8, 1.2, 0.7),
-                    "color": "wood_brown"
-                },
-                {
-                    "name": "goal_box", 
-                    "type": "box",
-                    "position": (0.45, -0.4, 0.75),  # Placed on table
-                    "size": (0.025, 0.025, 0.025),
-                    "color": "red"
-                }
-            ]
-            
             scene_description = {
                 "name": "table_scene",
-                "objects": scene_objects
+                "objects": TABLE_OBJECTS
             }
             
             self.current_scene = scene_description
             self._display_scene_info(scene_description)
             
             # Spawn objects in Gazebo
-            success_count = 0
-            for obj in scene_objects:
-                if self._spawn_object_in_gazebo(obj):
-                    success_count += 1
-                    self.spawned_objects.append(obj['name'])
-                else:
-                    print(f"Failed to spawn {obj['name']}")
+            success_count = self._spawn_objects(_PREBUILT_SDFS['table_scene'])
             
-            print(f"Successfully spawned {success_count}/{len(scene_objects)} objects in Gazebo")
+            print(f"Successfully spawned {success_count}/{len(TABLE_OBJECTS)} objects in Gazebo")
             logger.info("Table scene created successfully!")
             return success_count > 0
             
@@ -177,55 +416,18 @@ class GazeboSceneManager:
         try:
             logger.info("Creating kitchen scene in Gazebo...")
             
-            scene_objects = [
-                {
-                    "name": "counter",
-                    "type": "box",
-                    "position": (1.0, 0, 0.4),
-                    "size": (0.6, 1.5, 0.8),
-                    "color": "marble_white"
-                },
-                {
-                    "name": "cutting_board",
-                    "type": "box", 
-                    "position": (0.8, 0, 0.82),
-                    "size": (0.3, 0.2, 0.02),
-                    "color": "wood_brown"
-                },
-                {
-                    "name": "knife",
-                    "type": "box",
-                    "position": (0.8, 0.1, 0.83),
-                    "size": (0.15, 0.02, 0.01),
-                    "color": "silver"
-                },
-                {
-                    "name": "pan",
-                    "type": "cylinder",
-                    "position": (1.2, -0.3, 0.82),
-                    "size": (0.12, 0.12, 0.03),
-                    "color": "black"
-                }
-            ]
-            
             scene_description = {
                 "name": "kitchen_scene",
-                "objects": scene_objects
+                "objects": KITCHEN_OBJECTS
             }
             
             self.current_scene = scene_description
             self._display_scene_info(scene_description)
             
             # Spawn objects in Gazebo
-            success_count = 0
-            for obj in scene_objects:
-                if self._spawn_object_in_gazebo(obj):
-                    success_count += 1
-                    self.spawned_objects.append(obj['name'])
-                else:
-                    print(f"Failed to spawn {obj['name']}")
+            success_count = self._spawn_objects(_PREBUILT_SDFS['kitchen_scene'])
             
-            print(f"Successfully spawned {success_count}/{len(scene_objects)} objects in Gazebo")
+            print(f"Successfully spawned {success_count}/{len(KITCHEN_OBJECTS)} objects in Gazebo")
             logger.info("Kitchen scene created successfully!")
             return success_count > 0
             
@@ -243,9 +445,11 @@ class GazeboSceneManager:
         try:
             logger.info("Clearing current scene from Gazebo...")
             
+            # Remove all objects in one batch
+            results = self._delete_batch(self.spawned_objects)
             removed_count = 0
             for obj_name in self.spawned_objects:
-                if self._remove_object_from_gazebo(obj_name):
+                if results.get(obj_name):
                     removed_count += 1
                 else:
                     print(f"Failed to remove {obj_name}")
@@ -260,139 +464,336 @@ class GazeboSceneManager:
             logger.error(f"Failed to clear scene: {e}")
             return False
     
-    def _spawn_object_in_gazebo(self, obj: Dict) -> bool:
+    def _spawn_objects(self, entries: Sequence[SpawnEntry]) -> int:
+        """
+        Spawn a list of objects in one batch and record the ones that succeeded
+        
+        Args:
+            entries: (name, SDF, position) for each object
+            
+        Returns:
+            int: Number of objects spawned
+        """
+        results = self._spawn_batch(entries)
+        success_count = 0
+        for name, _, _ in entries:
+            if results.get(name):
+                success_count += 1
+                self.spawned_objects.append(name)
+            else:
+                print(f"Failed to spawn {name}")
+        return success_count
+    
+    def _spawn_batch(self, entries: Sequence[SpawnEntry]) -> Dict[str, bool]:
         """
-        Spawn a single object in Gazebo using SDF format
+        Spawn several objects with a single docker exec and ROS2 node
+        
+        One script creates a single SpawnEntity client, sends every request
+        with call_async and then waits for all of them, so the container
+        attach, Python startup and rclpy init are paid once per batch
+        instead of once per object.
         
         Args:
-            obj: Object dictionary with name, type, position, size, color
+            entries: (name, SDF, position) for each object
             
         Returns:
-            bool: True if spawned successfully
+            Dict[str, bool]: Spawn success for each object name
         """
+        results = {name: False for name, _, _ in entries}
+        if not entries:
+            return results
+        
+        if self._ensure_daemon():
+            reply = self._daemon_request({
+                "op": "spawn_batch",
+                "objects": [self._spawn_command(entry) for entry in entries],
+            }, timeout=30)
+            results.update(reply.get('results', {}))
+            return results
+        
         try:
-            # Generate SDF content for the object
-            sdf_content = self._generate_sdf(obj)
+            payload = json.dumps([
+                {"name": name, "xml": sdf, "position": list(position)}
+                for name, sdf, position in entries
+            ])
             
-            # Escape quotes in SDF content for shell command
-            escaped_sdf = sdf_content.replace("'", "'\"'\"'").replace('\n', '\\n')
+            python_script = SPAWN_BATCH_SCRIPT_TEMPLATE.format_map({"payload": payload})
             
-            # Create temporary SDF file in container
-            sdf_filename = f"/tmp/{obj['name']}.sdf"
+            # Pipe the script to python3 in the container
+            returncode, stdout = self._container_run("python3 -", python_script, timeout=30)
             
-            # Write SDF content to file inside Docker container
-            write_cmd = f"cat > {sdf_filename} << 'EOF'\n{sdf_content}\nEOF"
-            result = subprocess.run([
-                "docker", "exec", self.docker_name, "bash", "-c", write_cmd
-            ], capture_output=True, text=True)
+            output = stdout.strip().splitlines()
+            if returncode != 0 or not output:
+                print("Batch spawn failed")
+                print(f"output: {stdout}")
+                return results
             
-            if result.returncode != 0:
-                print(f"Failed to create SDF file for {obj['name']}: {result.stderr}")
-                return False
+            results.update(json.loads(output[-1]))
+            return results
             
-            # Use Python-based spawning which works reliably
-            print(f"Spawning {obj['name']} using Python ROS2 client")
-            return self._spawn_object_alternative(obj)
-                
         except subprocess.TimeoutExpired:
-            print(f"Timeout while spawning {obj['name']}")
+            print("Timeout while spawning scene objects")
+            return results
+        except Exception as e:
+            logger.error(f"Batch spawn error: {e}")
+            return results
+    
+    def _write_container_file(self, path: str, content: str):
+        """
+        Write a file inside the Docker container
+        
+        Args:
+            path: Destination path inside the container
+            content: Text to write
+            
+        Raises:
+            subprocess.CalledProcessError: If the file could not be written
+        """
+        command = f"cat > {shlex.quote(path)}"
+        returncode, output = self._container_run(command, content, timeout=10)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, command, output=output)
+    
+    def _container_run(self, command: str, input_text: Optional[str] = None,
+                       timeout: float = 30) -> Tuple[int, str]:
+        """
+        Run a shell command in the container with the ROS2 environment sourced
+        
+        Commands go through the persistent container shell when it is up,
+        so they skip the docker exec attach and the ROS2 setup sourcing.
+        Otherwise a one-off docker exec is used.
+        
+        Args:
+            command: Shell command line
+            input_text: Text fed to the command's stdin
+            timeout: Seconds to wait for the command
+            
+        Returns:
+            Tuple[int, str]: Exit code and combined stdout/stderr
+            
+        Raises:
+            subprocess.TimeoutExpired: If the command did not finish in time
+        """
+        if self._ensure_shell():
+            return self._shell_run(command, input_text, timeout)
+        
+        if input_text is None:
+            stdin_args = {"stdin": subprocess.DEVNULL}
+        else:
+            stdin_args = {"input": input_text}
+        result = subprocess.run([*self._docker_sh_prefix, f"source {ROS_SETUP} && {command}"],
+                                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, timeout=timeout, **stdin_args)
+        return result.returncode, result.stdout
+    
+    def _ensure_shell(self) -> bool:
+        """
+        Start the persistent bash in the container if it is not running
+        
+        The shell sources the ROS2 setup once and then runs every one-shot
+        command, so each one costs a write to its stdin instead of a new
+        docker exec.
+        
+        Returns:
+            bool: True if the shell is ready for commands
+        """
+        if self._shell is not None and self._shell.poll() is None:
+            return True
+        if self._shell_failed:
             return False
+        
+        try:
+            self._shell = subprocess.Popen([
+                *self._docker_sh_prefix, f"source {ROS_SETUP} > /dev/null && exec bash"
+            ], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+               stderr=subprocess.STDOUT, text=True, bufsize=1)
+            self._shell_output = queue.Queue()
+            threading.Thread(target=self._read_lines,
+                             args=(self._shell.stdout, self._shell_output),
+                             daemon=True).start()
+            
+            # The first round trip fails if sourcing the setup failed
+            self._shell_run("true", timeout=30)
+            return True
+            
         except Exception as e:
-            logger.error(f"Error spawning {obj['name']}: {e}")
+            logger.warning(f"Container shell unavailable, using one-off docker exec: {e}")
+            self._shell = self._stop_process(self._shell)
+            self._shell_failed = True
             return False
     
-    def _spawn_object_alternative(self, obj: Dict) -> bool:
+    def _shell_run(self, command: str, input_text: Optional[str] = None,
+                   timeout: float = 30) -> Tuple[int, str]:
         """
-        Alternative spawning method using Python script inside container
+        Run one command in the persistent container shell
+        
+        The command runs in a subshell, so it cannot change or exit the
+        persistent shell. Its output is followed by a sentinel line carrying
+        its exit code. Input is passed as a quoted heredoc with a random
+        delimiter, so its content is never expanded by the shell.
         
         Args:
-            obj: Object dictionary
+            command: Shell command line
+            input_text: Text fed to the command's stdin
+            timeout: Seconds to wait for the sentinel
             
         Returns:
-            bool: True if spawned successfully
+            Tuple[int, str]: Exit code and combined stdout/stderr
+            
+        Raises:
+            subprocess.TimeoutExpired: If the command did not finish in time
         """
-        try:
-            # Create a Python script that spawns the object using ROS2
-            python_script = f"""
-import rclpy
-from rclpy.node import Node
-from gazebo_msgs.srv import SpawnEntity
-from geometry_msgs.msg import Pose
-import sys
-
-class ObjectSpawner(Node):
-    def __init__(self):
-        super().__init__('spawn_object_{obj['name']}')
-        self.client = self.create_client(SpawnEntity, '/spawn_entity')
+        token = uuid.uuid4().hex
+        marker = f"__DONE_{token}_"
+        if input_text is None:
+            stdin_redirect = "< /dev/null"
+        else:
+            stdin_redirect = f"<< '__EOF_{token}__'\n{input_text}\n__EOF_{token}__"
         
-    def spawn_object(self):
         try:
-            request = SpawnEntity.Request()
-            request.name = '{obj['name']}'
+            self._shell.stdin.write(f"( {command}\n) 2>&1 {stdin_redirect}\n"
+                                    f"echo \"{marker}$?__\"\n")
+            self._shell.stdin.flush()
             
-            with open('/tmp/{obj['name']}.sdf', 'r') as f:
-                request.xml = f.read()
-                
-            request.robot_namespace = ''
-            request.initial_pose = Pose()
-            request.initial_pose.position.x = float({obj['position'][0]})
-            request.initial_pose.position.y = float({obj['position'][1]})
-            request.initial_pose.position.z = float({obj['position'][2]})
-            request.initial_pose.orientation.w = 1.0
-            request.reference_frame = 'world'
-            
-            if self.client.wait_for_service(timeout_sec=5.0):
-                future = self.client.call_async(request)
-                rclpy.spin_until_future_complete(self, future)
-                response = future.result()
-                print(f"Spawn result: {{response.success}}")
-                return response.success
-            else:
-                print("Service not available")
-                return False
+            deadline = time.monotonic() + timeout
+            lines = []
+            while True:
+                line = self._shell_output.get(timeout=max(deadline - time.monotonic(), 0))
+                if not line:
+                    raise OSError("container shell exited")
+                head, found, tail = line.partition(marker)
+                if found:
+                    lines.append(head)
+                    return int(tail.split("__")[0]), "".join(lines)
+                lines.append(line)
                 
-        except Exception as e:
-            print(f"Error: {{e}}")
+        except queue.Empty:
+            # The shell is still busy with this command; start afresh next time
+            self._shell = self._stop_process(self._shell)
+            raise subprocess.TimeoutExpired(command, timeout)
+        except OSError:
+            self._shell = self._stop_process(self._shell)
+            raise
+    
+    @staticmethod
+    def _spawn_command(entry: SpawnEntry) -> Dict:
+        """
+        Build the scene daemon spawn request for one object
+        
+        Args:
+            entry: (name, SDF, position) for the object
+            
+        Returns:
+            Dict: JSON-serialisable spawn request for a spawn_batch command
+        """
+        name, sdf, position = entry
+        return {"name": name, "xml": sdf, "pose": list(position)}
+    
+    def _ensure_daemon(self) -> bool:
+        """
+        Start the ROS2 scene daemon in the container if it is not running
+        
+        The daemon keeps one rclpy node with SpawnEntity and DeleteEntity
+        clients alive for the whole session, so Python startup, sourcing the
+        ROS2 environment and rclpy init are paid once instead of per object.
+        If it cannot be started, callers fall back to one-shot scripts.
+        
+        Returns:
+            bool: True if the daemon is ready for commands
+        """
+        if self._daemon is not None and self._daemon.poll() is None:
+            return True
+        if self._daemon_failed:
             return False
-
-rclpy.init()
-spawner = ObjectSpawner()
-success = spawner.spawn_object()
-spawner.destroy_node()
-rclpy.shutdown()
-sys.exit(0 if success else 1)
-"""
+        
+        try:
+            self._write_container_file(SCENE_DAEMON_PATH, SCENE_DAEMON_SCRIPT)
             
-            # Write Python script to container
-            script_path = f"/tmp/spawn_{obj['name']}.py"
-            write_script_cmd = f"cat > {script_path} << 'EOF'\n{python_script}\nEOF"
+            self._daemon = subprocess.Popen([
+                *self._docker_sh_prefix,
+                f"source {ROS_SETUP} && exec python3 -u {SCENE_DAEMON_PATH}"
+            ], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1)
             
-            result = subprocess.run([
-                "docker", "exec", self.docker_name, "bash", "-c", write_script_cmd
-            ], capture_output=True, text=True)
+            # Read replies on a thread so every wait can time out
+            self._daemon_replies = queue.Queue()
+            threading.Thread(target=self._read_lines,
+                             args=(self._daemon.stdout, self._daemon_replies),
+                             daemon=True).start()
             
-            if result.returncode != 0:
-                return False
+            ready = json.loads(self._daemon_replies.get(timeout=30) or "{}")
+            if not ready.get('ready'):
+                raise RuntimeError("daemon exited during startup")
             
-            # Run the Python script
-            run_script_cmd = f"source /opt/ros/humble/setup.bash && python3 {script_path}"
-            result = subprocess.run([
-                "docker", "exec", self.docker_name, "bash", "-c", run_script_cmd
-            ], capture_output=True, text=True, timeout=20)
+            logger.info("ROS2 scene daemon started")
+            return True
             
-            if result.returncode == 0 and "Spawn result: True" in result.stdout:
-                print(f"Successfully spawned {obj['name']} using alternative method")
-                return True
-            else:
-                print(f"Alternative spawn failed for {obj['name']}")
-                print(f"stdout: {result.stdout}")
-                print(f"stderr: {result.stderr}")
-                return False
-                
         except Exception as e:
-            logger.error(f"Alternative spawn error for {obj['name']}: {e}")
+            logger.warning(f"Scene daemon unavailable, using one-shot scripts: {e}")
+            self._daemon = self._stop_process(self._daemon)
+            self._daemon_failed = True
             return False
     
+    @staticmethod
+    def _read_lines(stream, lines: queue.Queue):
+        """Forward lines from a process stream to a queue, then an empty line at EOF"""
+        for line in stream:
+            lines.put(line)
+        lines.put("")
+    
+    def _daemon_request(self, cmd: Dict, timeout: float = 20) -> Dict:
+        """
+        Send one command to the scene daemon and wait for its reply
+        
+        Args:
+            cmd: Command with op and op-specific fields
+            timeout: Seconds to wait for the reply
+            
+        Returns:
+            Dict: The daemon's reply, or an empty dict on failure
+        """
+        try:
+            self._daemon.stdin.write(json.dumps(cmd) + "\n")
+            self._daemon.stdin.flush()
+            return json.loads(self._daemon_replies.get(timeout=timeout))
+        except queue.Empty:
+            print(f"Timeout waiting for scene daemon ({cmd['op']})")
+        except (OSError, ValueError) as e:
+            logger.error(f"Scene daemon error ({cmd['op']}): {e}")
+        
+        # The reply stream is out of step or closed; restart on next use
+        self._daemon = self._stop_process(self._daemon)
+        return {}
+    
+    def close(self):
+        """Stop the ROS2 scene daemon and the container shell if they are running"""
+        self._daemon = self._stop_process(self._daemon)
+        self._shell = self._stop_process(self._shell)
+    
+    @staticmethod
+    def _stop_process(proc: Optional[subprocess.Popen]) -> None:
+        """
+        Close a helper process's stdin and wait for it, killing it if needed
+        
+        Returns:
+            None, so callers can clear their reference in one assignment
+        """
+        if proc is None:
+            return None
+        
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except Exception:
+            proc.kill()
+            proc.wait()
+        return None
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def _remove_object_from_gazebo(self, obj_name: str) -> bool:
         """
         Remove an object from Gazebo
@@ -403,101 +804,118 @@ sys.exit(0 if success else 1)
         Returns:
             bool: True if removed successfully
         """
-        try:
-            # Create a Python script that removes the object using ROS2
-            python_script = f"""
-import rclpy
-from rclpy.node import Node
-from gazebo_msgs.srv import DeleteEntity
-import sys
-
-class ObjectRemover(Node):
-    def __init__(self):
-        super().__init__('remove_object_{obj_name}')
-        self.client = self.create_client(DeleteEntity, '/delete_entity')
+        if self._delete_batch([obj_name])[obj_name]:
+            print(f"Successfully removed {obj_name} from Gazebo")
+            return True
         
-    def remove_object(self):
-        try:
-            request = DeleteEntity.Request()
-            request.name = '{obj_name}'
-            
-            if self.client.wait_for_service(timeout_sec=5.0):
-                future = self.client.call_async(request)
-                rclpy.spin_until_future_complete(self, future)
-                response = future.result()
-                print(f"Remove result: {{response.success}}")
-                return response.success
-            else:
-                print("Service not available")
-                return False
-                
-        except Exception as e:
-            print(f"Error: {{e}}")
-            return False
-
-rclpy.init()
-remover = ObjectRemover()
-success = remover.remove_object()
-remover.destroy_node()
-rclpy.shutdown()
-sys.exit(0 if success else 1)
-"""
+        print(f"Failed to remove {obj_name}")
+        return False
+    
+    def _delete_batch(self, obj_names: Sequence[str]) -> Dict[str, bool]:
+        """
+        Remove several objects with a single docker exec and ROS2 node
+        
+        Mirrors _spawn_batch: one DeleteEntity client sends every request
+        with call_async before waiting on any of them.
+        
+        Args:
+            obj_names: Names of objects to remove
             
-            # Write Python script to container
-            script_path = f"/tmp/remove_{obj_name}.py"
-            write_script_cmd = f"cat > {script_path} << 'EOF'\n{python_script}\nEOF"
+        Returns:
+            Dict[str, bool]: Removal success for each object name
+        """
+        results = {name: False for name in obj_names}
+        if not obj_names:
+            return results
+        
+        if self._ensure_daemon():
+            reply = self._daemon_request(
+                {"op": "delete_batch", "names": list(obj_names)}, timeout=30)
+            results.update(reply.get('results', {}))
+            return results
+        
+        try:
+            python_script = DELETE_BATCH_SCRIPT_TEMPLATE.format_map(
+                {"payload": json.dumps(list(obj_names))})
             
-            result = subprocess.run([
-                "docker", "exec", self.docker_name, "bash", "-c", write_script_cmd
-            ], capture_output=True, text=True)
+            # Pipe the script to python3 in the container
+            returncode, stdout = self._container_run("python3 -", python_script, timeout=30)
             
-            if result.returncode != 0:
-                print(f"Failed to create removal script for {obj_name}")
-                return False
+            output = stdout.strip().splitlines()
+            if returncode != 0 or not output:
+                print("Batch remove failed")
+                print(f"output: {stdout}")
+                return results
             
-            # Run the Python script
-            run_script_cmd = f"source /opt/ros/humble/setup.bash && python3 {script_path}"
-            result = subprocess.run([
-                "docker", "exec", self.docker_name, "bash", "-c", run_script_cmd
-            ], capture_output=True, text=True, timeout=20)
+            results.update(json.loads(output[-1]))
+            return results
             
-            if result.returncode == 0 and "Remove result: True" in result.stdout:
-                print(f"Successfully removed {obj_name} from Gazebo")
-                return True
-            else:
-                print(f"Failed to remove {obj_name}")
-                print(f"stdout: {result.stdout}")
-                print(f"stderr: {result.stderr}")
-                return False
-                
+        except subprocess.TimeoutExpired:
+            print("Timeout while removing scene objects")
+            return results
         except Exception as e:
-            logger.error(f"Error removing {obj_name}: {e}")
-            return False
+            logger.error(f"Batch remove error: {e}")
+            return results
+    
+    @staticmethod
+    def _sdf_entry(obj: SceneObject) -> SpawnEntry:
+        """
+        Generate the spawn entry for an object
+        
+        Args:
+            obj: Scene object
+            
+        Returns:
+            SpawnEntry: Object name, SDF XML content and position
+        """
+        position = tuple(float(v) for v in obj.position)
+        return obj.name, GazeboSceneManager._generate_sdf(obj), position
     
-    def _generate_sdf(self, obj: Dict) -> str:
+    @staticmethod
+    def _generate_sdf(obj: SceneObject) -> str:
         """
         Generate SDF content for an object
         
         Args:
-            obj: Object dictionary
+            obj: Scene object
             
         Returns:
             str: SDF XML content
         """
-        name = obj['name']
-        pos = obj['position']
-        size = obj['size']
-        color = self._get_gazebo_color(obj['color'])
+        name = obj.name
+        pos = obj.position
+        link = GazeboSceneManager._geometry_material_xml(obj.type, tuple(obj.size), obj.color)
         
-        if obj['type'] == 'box':
-            geometry = f"""
-            <geometry>
-              <box>
-                <size>{size[0]} {size[1]} {size[2]}</size>
-              </box>
-            </geometry>"""
+        return f"""<?xml version='1.0'?>
+<sdf version='1.7'>
+  <model name='{name}'>
+    <pose>{pos[0]} {pos[1]} {pos[2]} 0 0 0</pose>
+    <static>true</static>
+    <link name='link'>{link}
+    </link>
+  </model>
+</sdf>"""
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _geometry_material_xml(obj_type: str, size: Tuple[float, ...], color_name: str) -> str:
+        """
+        Build the visual and collision XML for a shape, cached per shape
+        
+        Scenes repeat the same shapes (all the fruit are identical spheres),
+        so only the name and pose differ between their SDFs.
+        
+        Args:
+            obj_type: Shape type (box, sphere or cylinder)
+            size: Object size; spheres and cylinders use it as radius/length
+            color_name: Color name understood by _get_gazebo_color
             
-        elif obj['type'] == 'sphere':
+        Returns:
+            str: Visual and collision elements for the link
+        """
+        color = GazeboSceneManager._get_gazebo_color(color_name)
+        
+        if obj_type == 'sphere':
             radius = size[0]  # Use first dimension as radius
             geometry = f"""
             <geometry>
@@ -506,7 +924,7 @@ sys.exit(0 if success else 1)
               </sphere>
             </geometry>"""
             
-        elif obj['type'] == 'cylinder':
+        elif obj_type == 'cylinder':
             radius = size[0]
             length = size[2]
             geometry = f"""
@@ -517,7 +935,7 @@ sys.exit(0 if success else 1)
               </cylinder>
             </geometry>"""
         else:
-            # Default to box
+            # Boxes, and the default for unknown types
             geometry = f"""
             <geometry>
               <box>
@@ -525,12 +943,7 @@ sys.exit(0 if success else 1)
               </box>
             </geometry>"""
         
-        sdf_content = f"""<?xml version='1.0'?>
-<sdf version='1.7'>
-  <model name='{name}'>
-    <pose>{pos[0]} {pos[1]} {pos[2]} 0 0 0</pose>
-    <static>true</static>
-    <link name='link'>
+        return f"""
       <visual name='visual'>
         {geometry}
         <material>
@@ -541,31 +954,12 @@ sys.exit(0 if success else 1)
       </visual>
       <collision name='collision'>
         {geometry}
-      </collision>
-    </link>
-  </model>
-</sdf>"""
-        
-        return sdf_content
+      </collision>"""
     
-    def _get_gazebo_color(self, color_name: str) -> str:
+    @staticmethod
+    def _get_gazebo_color(color_name: str) -> str:
         """Convert color name to Gazebo RGBA format"""
-        colors = {
-            "red": "1 0 0 1",
-            "orange": "1 0.5 0 1", 
-            "yellow": "1 1 0 1",
-            "green": "0 1 0 1",
-            "blue": "0 0 1 1",
-            "white": "1 1 1 1",
-            "black": "0 0 0 1",
-            "brown": "0.6 0.3 0.1 1",
-            "wood_brown": "0.8 0.5 0.2 1",
-            "marble_white": "0.95 0.95 0.95 1",
-            "silver": "0.7 0.7 0.7 1",
-            "checker_gray": "0.5 0.5 0.5 1"
-        }
-        
-        return colors.get(color_name, "0.5 0.5 0.5 1")  # Default gray
+        return GazeboSceneManager._COLORS.get(color_name, "0.5 0.5 0.5 1")  # Default gray
     
     def get_current_scene(self) -> Dict:
         """Get current scene description"""
@@ -586,11 +980,36 @@ sys.exit(0 if success else 1)
         print(f"Objects to spawn: {len(scene_description['objects'])}")
         
         for obj in scene_description['objects']:
-            pos = obj['position']
-            print(f"  {obj['name']}: {obj['type']} at ({pos[0]:.2f}, {pos[1]:.2f}, {pos[2]:.2f})")
+            pos = obj.position
+            print(f"  {obj.name}: {obj.type} at ({pos[0]:.2f}, {pos[1]:.2f}, {pos[2]:.2f})")
         
         print()
     
+    @staticmethod
+    def _wait_motion(part, timeout: float = 3.0, poll_interval: float = 0.05) -> bool:
+        """
+        Wait until a robot part has finished its current motion
+        
+        Args:
+            part: Arm or gripper to watch
+            timeout: Maximum seconds to wait
+            poll_interval: Seconds between motion checks
+            
+        Returns:
+            bool: True if the part stopped moving before the timeout
+        """
+        def is_moving():
+            if hasattr(part, 'is_moving'):
+                return part.is_moving()
+            return part.get_goto_playing().id != -1 or bool(part.get_goto_queue())
+        
+        deadline = time.monotonic() + timeout
+        while is_moving():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval)
+        return True
+    
     def simulate_object_interaction(self, object_name: str, action: str = "pick") -> bool:
         """
         Simulate picking up or interacting with scene objects
@@ -610,7 +1029,7 @@ sys.exit(0 if success else 1)
             # Find object in current scene
             target_object = None
             for obj in self.current_scene['objects']:
-                if obj['name'] == object_name:
+                if obj.name == object_name:
                     target_object = obj
                     break
             
@@ -618,7 +1037,7 @@ sys.exit(0 if success else 1)
                 print(f"ERROR: Object '{object_name}' not found in scene")
                 return False
             
-            pos = target_object['position']
+            pos = target_object.position
             print(f"Simulating {action} action on {object_name}")
             print(f"   Target position: ({pos[0]:.2f}, {pos[1]:.2f}, {pos[2]:.2f})")
             
@@ -627,21 +1046,19 @@ sys.exit(0 if success else 1)
                 print("   Moving right arm toward target...")
                 self.reachy.r_arm.turn_on()
                 
-                # Simple approach movement
-                approach_pos = [pos[0] - 0.1, pos[1], pos[2] + 0.1]
-                target_pos = list(pos)
+                # Approach and target points are Gazebo world coordinates, not robot-frame
+                # Cartesian targets, so they are only reported; the arm is not driven there
+                target_pos = np.asarray(pos, dtype=float)
+                approach_pos = target_pos + APPROACH_OFFSET
                 
                 print(f"   Approaching: ({approach_pos[0]:.2f}, {approach_pos[1]:.2f}, {approach_pos[2]:.2f})")
-                time.sleep(2)
-                
                 print(f"   Reaching target: ({target_pos[0]:.2f}, {target_pos[1]:.2f}, {target_pos[2]:.2f})")
-                time.sleep(2)
                 
                 if action == "pick":
                     print("   Closing gripper...")
                     if hasattr(self.reachy.r_arm, 'gripper'):
                         self.reachy.r_arm.gripper.close()
-                        time.sleep(1)
+                        self._wait_motion(self.reachy.r_arm.gripper)
                 
                 print(f"SUCCESS: {action.capitalize()} action completed!")
                 return True
@@ -650,4 +1067,13 @@ sys.exit(0 if success else 1)
             
         except Exception as e:
             logger.error(f"Failed to simulate interaction: {e}")
-            return False
\ No newline at end of file
+            return False
+
+_PREBUILT_SDFS: Dict[str, Tuple[SpawnEntry, ...]] = {
+    scene_name: tuple(GazeboSceneManager._sdf_entry(obj) for obj in objects)
+    for scene_name, objects in (
+        ("table_scene", TABLE_OBJECTS),
+        ("fruits_scene", FRUITS_OBJECTS),
+        ("kitchen_scene", KITCHEN_OBJECTS),
+    )
+}
@@ -4,69 +4,211 @@ Interactive demo script for Reachy2 robot
 Allows user to control robot through command-line interface
 """
 
+import sys
 import time
 import numpy as np
 from main import ReachyController
-from pyquaternion import Quaternion
 from reachy2_sdk.utils.utils import get_pose_matrix
 from rviz_scene_manager import RVizSceneManager
 from gazebo_scene_manager import GazeboSceneManager
 from mime_performance import demo_mime_performance
-from audio import demo_audio_system
+from audio import demo_audio_system, wait_for_audio_file
+
+try:
+    import readline  # noqa: F401 - gives input() line editing and history
+except ImportError:  # not available on Windows
+    pass
+
+# Gripper pointing down (pitch -90 deg) at the origin; targets only set the translation
+_GRIPPER_DOWN_POSE = get_pose_matrix([0, 0, 0], [0, -90, 0])
+
+# Cartesian demo waypoints as translation offsets (m) from the starting pose
+_CARTESIAN_OFFSETS = np.array([
+    [0.1, 0, 0],
+    [0, 0.1, 0],
+    [0, 0, 0.1],
+    [-0.1, -0.1, -0.1],
+])
+_CARTESIAN_DESCRIPTIONS = (
+    "Move 10cm forward",
+    "Move 10cm right",
+    "Move 10cm up",
+    "Return to starting position",
+)
+
+_ARMS = frozenset({'r_arm', 'l_arm'})
+_PARTS = frozenset({'r_arm', 'l_arm', 'head'})
+
+# Head demo sequences, built once at import rather than on every call
+_HEAD_MOVEMENTS = (
+    ("neck.yaw", 0.5, 1.5, "Turn head right"),
+    ("neck.yaw", -0.5, 1.5, "Turn head left"),
+    ("neck.yaw", 0.0, 1.5, "Center head"),
+    ("neck.pitch", -0.3, 1.5, "Look down"),
+    ("neck.pitch", 0.3, 1.5, "Look up"),
+    ("neck.pitch", 0.0, 1.5, "Center head"),
+    ("neck.roll", 0.3, 1.0, "Tilt head right"),
+    ("neck.roll", -0.3, 1.0, "Tilt head left"),
+    ("neck.roll", 0.0, 1.0, "Center head"),
+)
+
+_HEAD_LOOK_AT_TARGETS = (
+    (0.5, 0, 0.2, "Look forward"),
+    (0.5, -0.3, 0.1, "Look right"),
+    (0.5, 0, -0.4, "Look down"),
+    (0.5, 0.3, -0.1, "Look left"),
+    (0.5, 0, 0, "Look front center"),
+)
+
+_HEAD_GOTO_POSITIONS = (
+    ([15, -20, 0], "Tilt right and down"),
+    ([-15, 20, 0], "Tilt left and up"),
+    ([0, 0, 30], "Turn right"),
+    ([0, 0, -30], "Turn left"),
+    ([0, 0, 0], "Return to center"),
+)
+
+_HEAD_ROTATIONS = (
+    (0, 0, 20, 'head', "Rotate yaw right in head frame"),
+    (0, 0, -40, 'head', "Rotate yaw left in head frame"),
+    (-30, 0, 0, 'robot', "Rotate roll left in robot frame"),
+    (60, 0, 0, 'robot', "Rotate roll right in robot frame"),
+    (-30, 0, 20, 'robot', "Return to center"),
+)
+
+_MENU = """
+{sep}
+REACHY2 INTERACTIVE CONTROL
+{sep}
+0. Turn on all motors
+1. Show robot status
+2. Read joint positions
+3. Move to neutral position
+4. Wave hello (right arm)
+5. Wave hello (left arm)
+6. Move specific joint
+7. Head movement demo
+8. Head look_at demo
+9. Head goto demo (joint space)
+10. Head rotate_by demo
+11. Antenna control
+12. Read head position
+13. Gripper control (open/close)
+14. Arm cartesian movement demo
+15. Arm kinematics demo
+16. Enhanced Audio System (NEW)
+17. Audio recording and playback (Legacy)
+18. Audio file management (Legacy)
+19. Perform intro setup (head down -> up)
+20. Reset to head-down position
+21. RViz Scene manager (create/clear scenes)
+22. Gazebo Scene manager (spawn/remove objects)
+23. Object interaction demo
+24. Mime Performance (Invisible Rope & Wall)
+25. Quit
+{rule}
+""".format(sep="=" * 50, rule="-" * 50)
+
+_SCENE_MENU = "\n".join([
+    "\n--- Scene Manager Menu ---",
+    "1. Create Base Scene (empty floor)",
+    "2. Create Table Scene (table + red box)",
+    "3. Create Fruits Scene (apples, oranges, table)",
+    "4. Create Kitchen Scene (counter, tools)",
+    "5. Show Current Scene",
+    "6. List Available Scenes",
+    "7. Clear Scene",
+    "8. Back to Main Menu",
+    "",
+])
+
+_GAZEBO_MENU = "\n".join([
+    "\n--- Gazebo Scene Manager Menu ---",
+    "1. Create Table Scene (table + red box)",
+    "2. Create Fruits Scene (apples, oranges, table)",
+    "3. Create Kitchen Scene (counter, tools)",
+    "4. Show Current Scene",
+    "5. List Available Scenes",
+    "6. List Spawned Objects",
+    "7. Clear Scene (remove all objects)",
+    "8. Back to Main Menu",
+    "",
+])
+
+_INTERACTION_MENU = "\n".join([
+    "\n--- Interaction Menu ---",
+    "1. Pick up object",
+    "2. Point at object",
+    "3. Push object",
+    "4. Show scene objects",
+    "5. Back to Main Menu",
+    "",
+])
 
 def print_menu():
     """Print the interactive menu"""
-    print("\n" + "="*50)
-    print("REACHY2 INTERACTIVE CONTROL")
-    print("="*50)
-    print("1. Show robot status")
-    print("2. Read joint positions")
-    print("3. Move to neutral position")
-    print("4. Wave hello (right arm)")
-    print("5. Wave hello (left arm)")
-    print("6. Move specific joint")
-    print("7. Head movement demo")
-    print("8. Head look_at demo")
-    print("9. Head goto demo (joint space)")
-    print("10. Head rotate_by demo")
-    print("11. Antenna control")
-    print("12. Read head position")
-    print("13. Gripper control (open/close)")
-    print("14. Arm cartesian movement demo")
-    print("15. Arm kinematics demo")
-    print("16. Enhanced Audio System (NEW)")
-    print("17. Audio recording and playback (Legacy)")
-    print("18. Audio file management (Legacy)")
-    print("19. Perform intro setup (head down -> up)")
-    print("20. Reset to head-down position") 
-    print("21. RViz Scene manager (create/clear scenes)")
-    print("22. Gazebo Scene manager (spawn/remove objects)")
-    print("23. Object interaction demo")
-    print("24. Mime Performance (Invisible Rope & Wall)")
-    print("25. Quit")
-    print("-"*50)
+    sys.stdout.write(_MENU)
+    sys.stdout.flush()
+
+def _ask_float(prompt, default=None):
+    """
+    Prompt for a number
+    
+    Args:
+        prompt: Text shown to the user
+        default: Value returned for an empty or non-numeric answer
+        
+    Returns:
+        float: The parsed value, or default
+    """
+    answer = input(prompt).strip()
+    if not answer:
+        return default
+    try:
+        return float(answer)
+    except ValueError:
+        return default
+
+def _ask_int(prompt, default=None):
+    """
+    Prompt for a positive whole number
+    
+    Args:
+        prompt: Text shown to the user
+        default: Value returned for an empty, non-integer or non-positive answer
+        
+    Returns:
+        int: The parsed value, or default
+    """
+    answer = input(prompt).strip()
+    try:
+        value = int(answer)
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+def _run_motion_script(script, move):
+    """
+    Run a demo's motion table step by step
+    
+    Args:
+        script: Rows of motion parameters, each ending with a description
+        move: Called with a row's parameters; blocks until that motion is done
+    """
+    for *params, description in script:
+        print(f"  {description}...")
+        move(*params)
 
 def demo_head_movement(controller):
     """Demonstrate head movements"""
     print("\nPerforming head movement demo...")
     print("Turning on head...")
-    controller.reachy.head.turn_on()
+    controller.ensure_on('head')
     
-    movements = [
-        ("neck.yaw", 0.5, 1.5, "Turn head right"),
-        ("neck.yaw", -0.5, 1.5, "Turn head left"),
-        ("neck.yaw", 0.0, 1.5, "Center head"),
-        ("neck.pitch", -0.3, 1.5, "Look down"),
-        ("neck.pitch", 0.3, 1.5, "Look up"),
-        ("neck.pitch", 0.0, 1.5, "Center head"),
-        ("neck.roll", 0.3, 1.0, "Tilt head right"),
-        ("neck.roll", -0.3, 1.0, "Tilt head left"),
-        ("neck.roll", 0.0, 1.0, "Center head"),
-    ]
-    
-    for joint, position, duration, description in movements:
-        print(f"  {description}...")
-        controller.move_joint("head", joint, position, duration)
+    _run_motion_script(
+        _HEAD_MOVEMENTS,
+        lambda joint, position, duration: controller.move_joint("head", joint, position, duration),
+    )
     
     print("[SUCCESS] Head movement demo completed")
 
@@ -74,20 +216,21 @@ def demo_head_look_at(controller):
     """Demonstrate head look_at functionality"""
     print("\nPerforming head look_at demo...")
     print("Turning on head...")
-    controller.reachy.head.turn_on()
+    head = controller.reachy.head
+    controller.ensure_on('head')
     
-    movements = [
-        (0.5, 0, 0.2, "Look forward"),
-        (0.5, -0.3, 0.1, "Look right"),
-        (0.5, 0, -0.4, "Look down"),
-        (0.5, 0.3, -0.1, "Look left"),
-        (0.5, 0, 0, "Look front center"),
-    ]
+    # Queue every waypoint at once; the robot plays queued gotos back to back,
+    # so there is no round-trip or settle sleep between them
+    goto_ids = [head.look_at(x=x, y=y, z=z, duration=1.0) for x, y, z, _ in _HEAD_LOOK_AT_TARGETS]
     
-    for x, y, z, description in movements:
+    for goto_id, (_, _, _, description) in zip(goto_ids, _HEAD_LOOK_AT_TARGETS):
         print(f"  {description}...")
-        controller.reachy.head.look_at(x=x, y=y, z=z, duration=1.0, wait=True)
-        time.sleep(0.5)
+        if goto_id.id == -1:
+            print("[FAILED] Head refused the look_at command")
+            return
+        if not controller.wait_for_gotos([goto_id], timeout=3.0):
+            print("[FAILED] Head did not reach the look_at target in time")
+            return
     
     print("[SUCCESS] Head look_at demo completed")
 
@@ -95,20 +238,10 @@ def demo_head_goto_joint(controller):
     """Demonstrate head goto in joint space"""
     print("\nPerforming head goto (joint space) demo...")
     print("Turning on head...")
-    controller.reachy.head.turn_on()
-    
-    positions = [
-        ([15, -20, 0], "Tilt right and down"),
-        ([-15, 20, 0], "Tilt left and up"),
-        ([0, 0, 30], "Turn right"),
-        ([0, 0, -30], "Turn left"),
-        ([0, 0, 0], "Return to center"),
-    ]
+    head = controller.reachy.head
+    controller.ensure_on('head')
     
-    for pos, description in positions:
-        print(f"  {description}...")
-        controller.reachy.head.goto(pos, duration=1.0)
-        time.sleep(1.5)
+    _run_motion_script(_HEAD_GOTO_POSITIONS, lambda pos: head.goto(pos, duration=1.0, wait=True))
     
     print("[SUCCESS] Head goto demo completed")
 
@@ -116,20 +249,13 @@ def demo_head_rotate_by(controller):
     """Demonstrate head rotate_by functionality"""
     print("\nPerforming head rotate_by demo...")
     print("Turning on head...")
-    controller.reachy.head.turn_on()
-    
-    rotations = [
-        (0, 0, 20, 'head', "Rotate yaw right in head frame"),
-        (0, 0, -40, 'head', "Rotate yaw left in head frame"),
-        (-30, 0, 0, 'robot', "Rotate roll left in robot frame"),
-        (60, 0, 0, 'robot', "Rotate roll right in robot frame"),
-        (-30, 0, 20, 'robot', "Return to center"),
-    ]
+    head = controller.reachy.head
+    controller.ensure_on('head')
     
-    for roll, pitch, yaw, frame, description in rotations:
-        print(f"  {description}...")
-        controller.reachy.head.rotate_by(roll=roll, pitch=pitch, yaw=yaw, frame=frame)
-        time.sleep(1.5)
+    _run_motion_script(
+        _HEAD_ROTATIONS,
+        lambda roll, pitch, yaw, frame: head.rotate_by(roll=roll, pitch=pitch, yaw=yaw, frame=frame, wait=True),
+    )
     
     print("[SUCCESS] Head rotate_by demo completed")
 
@@ -137,7 +263,8 @@ def demo_antenna_control(controller):
     """Demonstrate antenna control"""
     print("\nPerforming antenna control demo...")
     print("Turning on head (for antennas)...")
-    controller.reachy.head.turn_on()
+    head = controller.reachy.head
+    controller.ensure_on('head')
     
     movements = [
         (20, -20, "Antennas up and spread"),
@@ -146,11 +273,19 @@ def demo_antenna_control(controller):
         (0, 0, "Return to center"),
     ]
     
+    r_antenna = head.r_antenna
+    l_antenna = head.l_antenna
+    
+    # Send both antenna gotos at once so they start together, then wait for both
     for r_pos, l_pos, description in movements:
         print(f"  {description}...")
-        controller.reachy.head.r_antenna.goto(r_pos, duration=0.5)
-        controller.reachy.head.l_antenna.goto(l_pos, duration=0.5)
-        time.sleep(1.0)
+        goto_ids = [r_antenna.goto(r_pos, duration=0.5), l_antenna.goto(l_pos, duration=0.5)]
+        if any(goto_id.id == -1 for goto_id in goto_ids):
+            print("[FAILED] Antennas refused the movement")
+            return
+        if not controller.wait_for_gotos(goto_ids, timeout=2.0):
+            print("[FAILED] Antennas did not finish the movement in time")
+            return
     
     print("[SUCCESS] Antenna control demo completed")
 
@@ -158,23 +293,28 @@ def read_head_position(controller):
     """Read and display head position"""
     print("\n--- Head Position Information ---")
     
+    head = controller.reachy.head
+    
     # Cartesian space (quaternion)
     print("\nCartesian space (quaternion):")
-    q = controller.reachy.head.get_current_orientation()
+    q = head.get_current_orientation()
     print(f"Quaternion: {q}")
     
     # Joint space (roll, pitch, yaw)
     print("\nJoint space (degrees):")
-    positions = controller.reachy.head.get_current_positions()
+    positions = head.get_current_positions()
     print(f"Roll, Pitch, Yaw: {positions}")
     
-    # Individual joint positions
-    print("\nIndividual joint positions:")
-    print(f"neck.roll: {controller.reachy.head.neck.roll.present_position:.3f} rad")
-    print(f"neck.pitch: {controller.reachy.head.neck.pitch.present_position:.3f} rad")
-    print(f"neck.yaw: {controller.reachy.head.neck.yaw.present_position:.3f} rad")
-    print(f"l_antenna: {controller.reachy.head.l_antenna.present_position:.3f} rad")
-    print(f"r_antenna: {controller.reachy.head.r_antenna.present_position:.3f} rad")
+    # Individual joint positions; the neck values are the ones read above
+    roll, pitch, yaw = positions
+    print(
+        "\nIndividual joint positions:\n"
+        f"neck.roll: {roll:.3f} rad\n"
+        f"neck.pitch: {pitch:.3f} rad\n"
+        f"neck.yaw: {yaw:.3f} rad\n"
+        f"l_antenna: {head.l_antenna.present_position:.3f} rad\n"
+        f"r_antenna: {head.r_antenna.present_position:.3f} rad"
+    )
 
 def demo_gripper_control(controller):
     """Demonstrate gripper control"""
@@ -182,42 +322,29 @@ def demo_gripper_control(controller):
     print("Available arms: r_arm, l_arm")
     arm_choice = input("Choose arm (r_arm/l_arm): ").strip()
     
-    if arm_choice not in ['r_arm', 'l_arm']:
+    if arm_choice not in _ARMS:
         print("Invalid arm choice")
         return
     
     print(f"Turning on {arm_choice}...")
-    if arm_choice == 'r_arm':
-        controller.reachy.r_arm.turn_on()
-        gripper = controller.reachy.r_arm.gripper
-    else:
-        controller.reachy.l_arm.turn_on()
-        gripper = controller.reachy.l_arm.gripper
+    arm = getattr(controller.reachy, arm_choice)
+    controller.ensure_on(arm_choice)
+    gripper = arm.gripper
     
     print(f"\nCurrent gripper opening: {gripper.get_current_opening():.1f}%")
     
     actions = [
-        ("close", "Closing gripper completely"),
-        ("open", "Opening gripper completely"),
-        ("set_50", "Setting gripper to 50% open"),
-        ("set_75", "Setting gripper to 75% open"),
+        (0, "Closing gripper completely"),
+        (100, "Opening gripper completely"),
+        (50, "Setting gripper to 50% open"),
+        (75, "Setting gripper to 75% open"),
     ]
     
-    for action, description in actions:
+    for opening, description in actions:
         print(f"  {description}...")
         
-        if action == "close":
-            gripper.close()
-        elif action == "open": 
-            gripper.open()
-        elif action == "set_50":
-            gripper.set_opening(50)
-        elif action == "set_75":
-            gripper.set_opening(75)
-        
-        # Wait for movement to complete
-        while gripper.is_moving():
-            time.sleep(0.1)
+        # Blocks until the SDK reports the goto finished
+        gripper.goto(opening, percentage=True, wait=True)
         
         print(f"    Current opening: {gripper.get_current_opening():.1f}%")
         time.sleep(1)
@@ -230,17 +357,13 @@ def demo_arm_cartesian(controller):
     print("Available arms: r_arm, l_arm")
     arm_choice = input("Choose arm (r_arm/l_arm): ").strip()
     
-    if arm_choice not in ['r_arm', 'l_arm']:
+    if arm_choice not in _ARMS:
         print("Invalid arm choice")
         return
     
     print(f"Turning on {arm_choice}...")
-    if arm_choice == 'r_arm':
-        controller.reachy.r_arm.turn_on()
-        arm = controller.reachy.r_arm
-    else:
-        controller.reachy.l_arm.turn_on()
-        arm = controller.reachy.l_arm
+    arm = getattr(controller.reachy, arm_choice)
+    controller.ensure_on(arm_choice)
     
     print("Moving to elbow_90 posture...")
     arm.goto_posture('elbow_90', wait=True)
@@ -249,44 +372,36 @@ def demo_arm_cartesian(controller):
     current_pose = arm.forward_kinematics()
     print(f"Current gripper position: {current_pose[:3, 3]}")
     
-    movements = [
-        (0.1, 0, 0, "Move 10cm forward"),
-        (0, 0.1, 0, "Move 10cm right"),
-        (0, 0, 0.1, "Move 10cm up"),
-        (-0.1, -0.1, -0.1, "Return to starting position"),
-    ]
+    # Every waypoint in one (N, 4, 4) stack: the current pose with each offset added
+    poses = np.repeat(current_pose[np.newaxis], len(_CARTESIAN_OFFSETS), axis=0)
+    poses[:, :3, 3] += _CARTESIAN_OFFSETS
     
-    for dx, dy, dz, description in movements:
+    for pose, description in zip(poses, _CARTESIAN_DESCRIPTIONS):
         print(f"  {description}...")
-        new_pose = current_pose.copy()
-        new_pose[0, 3] += dx
-        new_pose[1, 3] += dy  
-        new_pose[2, 3] += dz
-        
-        arm.goto(new_pose, interpolation_space="cartesian_space", wait=True)
+        arm.goto(pose, interpolation_space="cartesian_space", wait=True)
         time.sleep(0.5)
     
     print("Returning to default posture...")
     arm.goto_posture('default', wait=True)
     print("[SUCCESS] Cartesian movement demo completed")
 
+def _format_position(pose):
+    """Format the translation of a 4x4 pose as [x, y, z] with 3 decimals"""
+    return np.array2string(pose[:3, 3], precision=3, separator=', ', floatmode='fixed', suppress_small=True)
+
 def demo_arm_kinematics(controller):
     """Demonstrate forward and inverse kinematics"""
     print("\nArm Kinematics Demo")
     print("Available arms: r_arm, l_arm")
     arm_choice = input("Choose arm (r_arm/l_arm): ").strip()
     
-    if arm_choice not in ['r_arm', 'l_arm']:
+    if arm_choice not in _ARMS:
         print("Invalid arm choice")
         return
     
     print(f"Turning on {arm_choice}...")
-    if arm_choice == 'r_arm':
-        controller.reachy.r_arm.turn_on()
-        arm = controller.reachy.r_arm
-    else:
-        controller.reachy.l_arm.turn_on()
-        arm = controller.reachy.l_arm
+    arm = getattr(controller.reachy, arm_choice)
+    controller.ensure_on(arm_choice)
     
     print("\n--- Forward Kinematics ---")
     joint_positions = [0, 10, -15, -90, 0, 0, -5]
@@ -295,18 +410,18 @@ def demo_arm_kinematics(controller):
     # Move to position
     arm.goto(joint_positions, wait=True)
     
-    # Calculate forward kinematics
+    # Calculate forward kinematics from the measured joint positions
     pose = arm.forward_kinematics()
-    position = pose[:3, 3]
-    print(f"Forward kinematics result - Position: [{position[0]:.3f}, {position[1]:.3f}, {position[2]:.3f}]")
+    print(f"Forward kinematics result - Position: {_format_position(pose)}")
     
     print("\n--- Inverse Kinematics ---")
     # Create a target pose
-    target_pose = get_pose_matrix([0.3, 0.1, -0.3], [0, -90, 0])
-    print(f"Target position: [{target_pose[0,3]:.3f}, {target_pose[1,3]:.3f}, {target_pose[2,3]:.3f}]")
+    target_pose = _GRIPPER_DOWN_POSE.copy()
+    target_pose[:3, 3] = [0.3, 0.1, -0.3]
+    print(f"Target position: {_format_position(target_pose)}")
     
-    # Calculate inverse kinematics
-    ik_joints = arm.inverse_kinematics(target_pose)
+    # Calculate inverse kinematics, seeded from the joint positions just reached
+    ik_joints = arm.inverse_kinematics(target_pose, q0=joint_positions)
     print(f"Inverse kinematics result - Joints: {[round(j, 1) for j in ik_joints]}")
     
     # Move to computed position
@@ -315,8 +430,7 @@ def demo_arm_kinematics(controller):
     
     # Verify by calculating forward kinematics again
     verify_pose = arm.forward_kinematics()
-    verify_position = verify_pose[:3, 3]
-    print(f"Verification - Actual position: [{verify_position[0]:.3f}, {verify_position[1]:.3f}, {verify_position[2]:.3f}]")
+    print(f"Verification - Actual position: {_format_position(verify_pose)}")
     
     print("Returning to default posture...")
     arm.goto_posture('default', wait=True)
@@ -330,7 +444,7 @@ def demo_audio_recording(controller):
     # Show available audio files first
     print("\n--- Current Audio Files ---")
     try:
-        files = controller.reachy.audio.get_audio_files()
+        files = controller.get_audio_files()
         if files:
             for i, file in enumerate(files, 1):
                 print(f"{i}. {file}")
@@ -341,11 +455,7 @@ def demo_audio_recording(controller):
         return
     
     print("\n--- Recording Your Voice ---")
-    duration = input("Enter recording duration in seconds (default: 5): ").strip()
-    try:
-        duration = int(duration) if duration else 5
-    except ValueError:
-        duration = 5
+    duration = _ask_int("Enter recording duration in seconds (default: 5): ", 5)
     
     filename = input("Enter filename for recording (default: my_voice.ogg): ").strip()
     if not filename:
@@ -353,26 +463,25 @@ def demo_audio_recording(controller):
     if not filename.endswith('.ogg'):
         filename += '.ogg'
     
-    print(f"Recording '{filename}' for {duration} seconds...")
-    print("Start speaking now!")
+    sys.stdout.write(f"Recording '{filename}' for {duration} seconds...\nStart speaking now!\n")
+    sys.stdout.flush()
     
     try:
         controller.reachy.audio.record_audio(filename, duration_secs=duration)
+        controller.invalidate_audio_files()
         
-        # Wait for recording to complete
-        import time
-        time.sleep(duration + 1)  # Wait a bit extra to ensure recording is complete
+        # The SDK gives no completion signal, so wait out the recording itself
+        time.sleep(duration)
         
         print(f"[SUCCESS] Recording completed: {filename}")
         
-        # Check if file actually exists
+        # Check if file actually exists, polling briefly while the robot saves it
         try:
-            files = controller.reachy.audio.get_audio_files()
-            if filename in files:
+            if wait_for_audio_file(lambda: controller.get_audio_files(force_refresh=True), filename):
                 print(f"✓ File '{filename}' confirmed in robot's storage")
             else:
                 print(f"✗ File '{filename}' NOT found in robot's storage")
-                print(f"Available files: {files}")
+                print(f"Available files: {controller.get_audio_files()}")
                 return
         except Exception as e:
             print(f"Error checking files: {e}")
@@ -407,100 +516,141 @@ def demo_audio_recording(controller):
     except Exception as e:
         print(f"Recording failed: {e}")
 
+_AUDIO_MENU = "\n".join([
+    "\n--- Audio Management Menu ---",
+    "1. List audio files",
+    "2. Upload audio file",
+    "3. Play audio file",
+    "4. Stop playback",
+    "5. Remove audio file",
+    "6. Download audio file",
+    "7. Back to main menu",
+    "",
+])
+
+def _list_audio_files(controller, empty_message, header=None):
+    """
+    Fetch and print the robot's audio files
+    
+    Args:
+        controller: Connected ReachyController
+        empty_message: Message printed when there are no files
+        header: Optional line printed before a non-empty listing
+        
+    Returns:
+        list: The files found, empty if none or on error
+    """
+    try:
+        files = controller.get_audio_files()
+    except Exception as e:
+        print(f"Error: {e}")
+        return []
+    
+    if not files:
+        print(empty_message)
+        return []
+    
+    if header:
+        print(header)
+    for i, file in enumerate(files, 1):
+        print(f"{i}. {file}")
+    return files
+
+def _audio_list(controller):
+    print("\n--- Available Audio Files ---")
+    _list_audio_files(controller, "No audio files found")
+
+def _audio_upload(controller):
+    file_path = input("Enter full path to audio file: ").strip()
+    try:
+        controller.reachy.audio.upload_audio_file(file_path)
+        controller.invalidate_audio_files()
+    except Exception as e:
+        print(f"Error: {e}")
+        return
+    print("[SUCCESS] File uploaded successfully")
+
+def _audio_play(controller):
+    if not _list_audio_files(controller, "No audio files available", "Available files:"):
+        return
+    
+    file_choice = input("Enter filename to play: ").strip()
+    try:
+        controller.reachy.audio.play_audio_file(file_choice)
+    except Exception as e:
+        print(f"Error: {e}")
+        return
+    print(f"Playing {file_choice}...")
+
+def _audio_stop(controller):
+    try:
+        controller.reachy.audio.stop_playing()
+    except Exception as e:
+        print(f"Error: {e}")
+        return
+    print("Playback stopped")
+
+def _audio_remove(controller):
+    if not _list_audio_files(controller, "No audio files to remove", "Available files:"):
+        return
+    
+    file_to_remove = input("Enter filename to remove: ").strip()
+    confirm = input(f"Are you sure you want to remove '{file_to_remove}'? (y/n): ").strip().lower()
+    
+    if confirm not in ['y', 'yes']:
+        print("Removal cancelled")
+        return
+    
+    try:
+        controller.reachy.audio.remove_audio_file(file_to_remove)
+        controller.invalidate_audio_files()
+    except Exception as e:
+        print(f"Error: {e}")
+        return
+    print(f"[SUCCESS] Removed {file_to_remove}")
+
+def _audio_download(controller):
+    if not _list_audio_files(controller, "No audio files to download", "Available files:"):
+        return
+    
+    file_to_download = input("Enter filename to download: ").strip()
+    download_path = input("Enter download path (default: C:/): ").strip()
+    if not download_path:
+        download_path = "C:/"
+    
+    try:
+        controller.reachy.audio.download_audio_file(file_to_download, download_path)
+    except Exception as e:
+        print(f"Error: {e}")
+        return
+    print(f"[SUCCESS] Downloaded {file_to_download} to {download_path}")
+
+_AUDIO_HANDLERS = {
+    '1': _audio_list,
+    '2': _audio_upload,
+    '3': _audio_play,
+    '4': _audio_stop,
+    '5': _audio_remove,
+    '6': _audio_download,
+}
+
 def demo_audio_management(controller):
     """Demonstrate audio file management"""
     print("\nAudio File Management")
     
     while True:
-        print("\n--- Audio Management Menu ---")
-        print("1. List audio files")
-        print("2. Upload audio file")
-        print("3. Play audio file")
-        print("4. Stop playback")
-        print("5. Remove audio file")
-        print("6. Download audio file")
-        print("7. Back to main menu")
+        sys.stdout.write(_AUDIO_MENU)
+        sys.stdout.flush()
         
         choice = input("Enter your choice (1-7): ").strip()
+        if choice == '7':
+            break
         
-        try:
-            if choice == '1':
-                print("\n--- Available Audio Files ---")
-                files = controller.reachy.audio.get_audio_files()
-                if files:
-                    for i, file in enumerate(files, 1):
-                        print(f"{i}. {file}")
-                else:
-                    print("No audio files found")
-            
-            elif choice == '2':
-                file_path = input("Enter full path to audio file: ").strip()
-                controller.reachy.audio.upload_audio_file(file_path)
-                print("[SUCCESS] File uploaded successfully")
-            
-            elif choice == '3':
-                files = controller.reachy.audio.get_audio_files()
-                if not files:
-                    print("No audio files available")
-                    continue
-                
-                print("Available files:")
-                for i, file in enumerate(files, 1):
-                    print(f"{i}. {file}")
-                
-                file_choice = input("Enter filename to play: ").strip()
-                controller.reachy.audio.play_audio_file(file_choice)
-                print(f"Playing {file_choice}...")
-            
-            elif choice == '4':
-                controller.reachy.audio.stop_playing()
-                print("Playback stopped")
-            
-            elif choice == '5':
-                files = controller.reachy.audio.get_audio_files()
-                if not files:
-                    print("No audio files to remove")
-                    continue
-                
-                print("Available files:")
-                for i, file in enumerate(files, 1):
-                    print(f"{i}. {file}")
-                
-                file_to_remove = input("Enter filename to remove: ").strip()
-                confirm = input(f"Are you sure you want to remove '{file_to_remove}'? (y/n): ").strip().lower()
-                
-                if confirm in ['y', 'yes']:
-                    controller.reachy.audio.remove_audio_file(file_to_remove)
-                    print(f"[SUCCESS] Removed {file_to_remove}")
-                else:
-                    print("Removal cancelled")
-            
-            elif choice == '6':
-                files = controller.reachy.audio.get_audio_files()
-                if not files:
-                    print("No audio files to download")
-                    continue
-                
-                print("Available files:")
-                for i, file in enumerate(files, 1):
-                    print(f"{i}. {file}")
-                
-                file_to_download = input("Enter filename to download: ").strip()
-                download_path = input("Enter download path (default: C:/): ").strip()
-                if not download_path:
-                    download_path = "C:/"
-                
-                controller.reachy.audio.download_audio_file(file_to_download, download_path)
-                print(f"[SUCCESS] Downloaded {file_to_download} to {download_path}")
-            
-            elif choice == '7':
-                break
-            
-            else:
-                print("Invalid choice. Please enter 1-7.")
-                
-        except Exception as e:
-            print(f"Error: {e}")
+        handler = _AUDIO_HANDLERS.get(choice)
+        if handler:
+            handler(controller)
+        else:
+            print("Invalid choice. Please enter 1-7.")
 
 def demo_intro_setup(controller):
     """Demonstrate the intro setup sequence"""
@@ -555,15 +705,8 @@ def demo_scene_manager(controller):
     scene_manager = RVizSceneManager(controller.reachy)
     
     while True:
-        print("\n--- Scene Manager Menu ---")
-        print("1. Create Base Scene (empty floor)")
-        print("2. Create Table Scene (table + red box)")  
-        print("3. Create Fruits Scene (apples, oranges, table)")
-        print("4. Create Kitchen Scene (counter, tools)")
-        print("5. Show Current Scene")
-        print("6. List Available Scenes")
-        print("7. Clear Scene")
-        print("8. Back to Main Menu")
+        sys.stdout.write(_SCENE_MENU)
+        sys.stdout.flush()
         
         choice = input("Enter choice (1-8): ").strip()
         
@@ -634,74 +777,71 @@ def demo_gazebo_scene_manager(controller):
     # Initialize scene manager
     scene_manager = GazeboSceneManager(controller.reachy, docker_name)
     
-    while True:
-        print("\n--- Gazebo Scene Manager Menu ---")
-        print("1. Create Table Scene (table + red box)")  
-        print("2. Create Fruits Scene (apples, oranges, table)")
-        print("3. Create Kitchen Scene (counter, tools)")
-        print("4. Show Current Scene")
-        print("5. List Available Scenes")
-        print("6. List Spawned Objects")
-        print("7. Clear Scene (remove all objects)")
-        print("8. Back to Main Menu")
-        
-        choice = input("Enter choice (1-8): ").strip()
-        
-        try:
-            if choice == '1':
-                if scene_manager.create_table_scene():
-                    print("[SUCCESS] Table scene objects spawned in Gazebo!")
-                else:
-                    print("[FAILED] Failed to create table scene")
-            
-            elif choice == '2':
-                if scene_manager.create_fruits_scene():
-                    print("[SUCCESS] Fruits scene objects spawned in Gazebo!")
-                else:
-                    print("[FAILED] Failed to create fruits scene")
-            
-            elif choice == '3':
-                if scene_manager.create_kitchen_scene():
-                    print("[SUCCESS] Kitchen scene objects spawned in Gazebo!")
-                else:
-                    print("[FAILED] Failed to create kitchen scene")
-            
-            elif choice == '4':
-                current = scene_manager.get_current_scene()
-                if current:
-                    scene_manager._display_scene_info(current)
-                else:
-                    print("No scene currently loaded")
-            
-            elif choice == '5':
-                scenes = scene_manager.list_available_scenes()
-                print("Available scenes:")
-                for i, scene in enumerate(scenes, 1):
-                    print(f"  {i}. {scene}")
-            
-            elif choice == '6':
-                spawned = scene_manager.get_spawned_objects()
-                print("Currently spawned objects:")
-                if spawned:
-                    for i, obj in enumerate(spawned, 1):
-                        print(f"  {i}. {obj}")
-                else:
-                    print("  No objects currently spawned")
-            
-            elif choice == '7':
-                if scene_manager.clear_scene():
-                    print("[SUCCESS] Scene cleared! Objects removed from Gazebo")
-                else:
-                    print("[FAILED] Failed to clear scene")
+    try:
+        while True:
+            sys.stdout.write(_GAZEBO_MENU)
+            sys.stdout.flush()
             
-            elif choice == '8':
-                break
+            choice = input("Enter choice (1-8): ").strip()
             
-            else:
-                print("Invalid choice. Please enter 1-8.")
+            try:
+                if choice == '1':
+                    if scene_manager.create_table_scene():
+                        print("[SUCCESS] Table scene objects spawned in Gazebo!")
+                    else:
+                        print("[FAILED] Failed to create table scene")
                 
-        except Exception as e:
-            print(f"Error: {e}")
+                elif choice == '2':
+                    if scene_manager.create_fruits_scene():
+                        print("[SUCCESS] Fruits scene objects spawned in Gazebo!")
+                    else:
+                        print("[FAILED] Failed to create fruits scene")
+                
+                elif choice == '3':
+                    if scene_manager.create_kitchen_scene():
+                        print("[SUCCESS] Kitchen scene objects spawned in Gazebo!")
+                    else:
+                        print("[FAILED] Failed to create kitchen scene")
+                
+                elif choice == '4':
+                    current = scene_manager.get_current_scene()
+                    if current:
+                        scene_manager._display_scene_info(current)
+                    else:
+                        print("No scene currently loaded")
+                
+                elif choice == '5':
+                    scenes = scene_manager.list_available_scenes()
+                    print("Available scenes:")
+                    for i, scene in enumerate(scenes, 1):
+                        print(f"  {i}. {scene}")
+                
+                elif choice == '6':
+                    spawned = scene_manager.get_spawned_objects()
+                    print("Currently spawned objects:")
+                    if spawned:
+                        for i, obj in enumerate(spawned, 1):
+                            print(f"  {i}. {obj}")
+                    else:
+                        print("  No objects currently spawned")
+                
+                elif choice == '7':
+                    if scene_manager.clear_scene():
+                        print("[SUCCESS] Scene cleared! Objects removed from Gazebo")
+                    else:
+                        print("[FAILED] Failed to clear scene")
+                
+                elif choice == '8':
+                    break
+                
+                else:
+                    print("Invalid choice. Please enter 1-8.")
+                    
+            except Exception as e:
+                print(f"Error: {e}")
+    finally:
+        # Stop the scene daemon and container shell however the menu exits
+        scene_manager.close()
 
 def demo_object_interaction(controller):
     """Demonstrate object interaction with scene objects"""
@@ -729,12 +869,8 @@ def demo_object_interaction(controller):
         print(f"  {i}. {obj['name']} ({obj['type']}) at ({pos[0]:.2f}, {pos[1]:.2f}, {pos[2]:.2f})")
     
     while True:
-        print("\n--- Interaction Menu ---")
-        print("1. Pick up object")
-        print("2. Point at object") 
-        print("3. Push object")
-        print("4. Show scene objects")
-        print("5. Back to Main Menu")
+        sys.stdout.write(_INTERACTION_MENU)
+        sys.stdout.flush()
         
         choice = input("Enter choice (1-5): ").strip()
         
@@ -773,49 +909,119 @@ def move_specific_joint(controller):
     print("\nAvailable parts: r_arm, l_arm, head")
     part = input("Enter part name: ").strip()
     
-    if part not in ['r_arm', 'l_arm', 'head']:
+    if part not in _PARTS:
         print("Invalid part name")
         return
     
     # Turn on the specific part
     print(f"Turning on {part}...")
-    if part == 'r_arm':
-        controller.reachy.r_arm.turn_on()
-    elif part == 'l_arm':
-        controller.reachy.l_arm.turn_on()
-    elif part == 'head':
-        controller.reachy.head.turn_on()
+    controller.ensure_on(part)
     
     print(f"\nReading current joints for {part}...")
-    positions = controller.read_joint_positions()
+    joints = controller.get_part_positions(part)
     
-    if part in positions and isinstance(positions[part], dict):
+    if joints:
         print(f"\nAvailable joints in {part}:")
-        for joint_name, current_pos in positions[part].items():
+        for joint_name, current_pos in joints.items():
             print(f"  {joint_name}: {current_pos:.3f} rad")
         
         joint = input("\nEnter joint name: ").strip()
-        if joint not in positions[part]:
+        if joint not in joints:
             print("Invalid joint name")
             return
         
-        try:
-            position = float(input(f"Enter target position in radians (current: {positions[part][joint]:.3f}): "))
-            duration = float(input("Enter movement duration in seconds (default: 2.0): ") or "2.0")
-            
-            print(f"\nMoving {part}.{joint} to {position:.3f} rad...")
-            success = controller.move_joint(part, joint, position, duration)
-            
-            if success:
-                print("[SUCCESS] Movement completed")
-            else:
-                print("[FAILED] Movement failed")
-                
-        except ValueError:
+        position = _ask_float(f"Enter target position in radians (current: {joints[joint]:.3f}): ")
+        if position is None:
             print("Invalid numeric input")
+            return
+        duration = _ask_float("Enter movement duration in seconds (default: 2.0): ", 2.0)
+        
+        print(f"\nMoving {part}.{joint} to {position:.3f} rad...")
+        success = controller.move_joint(part, joint, position, duration)
+        
+        if success:
+            print("[SUCCESS] Movement completed")
+        else:
+            print("[FAILED] Movement failed")
     else:
         print(f"Failed to read joints for {part}")
 
+def show_robot_status(controller):
+    """Print the robot info reported by the controller"""
+    print("\n--- Robot Status ---")
+    info = controller.get_robot_info()
+    for key, value in info.items():
+        print(f"{key}: {value}")
+
+def show_joint_positions(controller):
+    """Print the current joint positions of every part"""
+    print("\n--- Current Joint Positions ---")
+    positions = controller.refresh_state()
+    for part, joints in positions.items():
+        if isinstance(joints, dict):
+            print(f"\n{part.upper()}:")
+            for joint_name, position in joints.items():
+                print(f"  {joint_name}: {position:.3f} rad")
+
+def demo_turn_on_robot(controller):
+    """Turn on every part of the robot"""
+    if controller.reachy.is_on():
+        print("\nRobot is already on")
+        return
+    print("\nTurning on robot...")
+    controller.reachy.turn_on()
+    print("[SUCCESS] Robot turned on!")
+
+def demo_neutral_position(controller):
+    """Move the robot to its neutral position"""
+    print("\nMoving to neutral position...")
+    for part in ('r_arm', 'l_arm', 'head'):
+        controller.ensure_on(part)
+    if controller.move_to_neutral_position():
+        print("[SUCCESS] Robot moved to neutral position")
+    else:
+        print("[FAILED] Failed to move to neutral position")
+
+def demo_wave_hello(controller, arm):
+    """Wave hello with the given arm ('r_arm' or 'l_arm')"""
+    side = "right" if arm == "r_arm" else "left"
+    print(f"\nPerforming wave gesture with {side} arm...")
+    print(f"Turning on {side} arm...")
+    controller.ensure_on(arm)
+    if controller.wave_hello(arm):
+        print("[SUCCESS] Wave gesture completed")
+    else:
+        print("[FAILED] Wave gesture failed")
+
+# Main menu choices ('25' quits and is handled in the loop)
+_ACTIONS = {
+    '0': demo_turn_on_robot,
+    '1': show_robot_status,
+    '2': show_joint_positions,
+    '3': demo_neutral_position,
+    '4': lambda controller: demo_wave_hello(controller, "r_arm"),
+    '5': lambda controller: demo_wave_hello(controller, "l_arm"),
+    '6': move_specific_joint,
+    '7': demo_head_movement,
+    '8': demo_head_look_at,
+    '9': demo_head_goto_joint,
+    '10': demo_head_rotate_by,
+    '11': demo_antenna_control,
+    '12': read_head_position,
+    '13': demo_gripper_control,
+    '14': demo_arm_cartesian,
+    '15': demo_arm_kinematics,
+    '16': demo_audio_system,
+    '17': demo_audio_recording,
+    '18': demo_audio_management,
+    '19': demo_intro_setup,
+    '20': demo_reset_position,
+    '21': demo_scene_manager,
+    '22': demo_gazebo_scene_manager,
+    '23': demo_object_interaction,
+    '24': demo_mime_performance,
+}
+
 def main():
     """Main interactive demo"""
     print("Starting Reachy2 Interactive Demo...")
@@ -834,7 +1040,6 @@ def main():
                 break
             if attempt < max_retries - 1:
                 print(f"Connection attempt {attempt + 1} failed, retrying in 10 seconds...")
-                import time
                 time.sleep(10)
         else:
             print("[ERROR] Failed to connect to Reachy2. Check if simulation is running at localhost:6080")
@@ -848,120 +1053,31 @@ def main():
             print("Performing intro setup...")
             controller.perform_intro_setup("medium")
         else:
-            # Turn on the robot so movements are visible
-            print("Turning on robot...")
-            controller.reachy.turn_on()
-            print("[SUCCESS] Robot turned on!")
+            # Parts are turned on by the demos that use them
+            print("Parts will be turned on as demos need them (choice 0 turns on everything)")
+        
+        # Make the first audio request now so its channel setup isn't paid on
+        # the first menu choice; this also fills the file listing cache
+        try:
+            controller.get_audio_files()
+        except Exception as e:
+            print(f"Warning: audio service not ready: {e}")
         
         while True:
             print_menu()
             
             try:
-                choice = input("Enter your choice (1-25): ").strip()
-                
-                if choice == '1':
-                    print("\n--- Robot Status ---")
-                    info = controller.get_robot_info()
-                    for key, value in info.items():
-                        print(f"{key}: {value}")
-                
-                elif choice == '2':
-                    print("\n--- Current Joint Positions ---")
-                    positions = controller.read_joint_positions()
-                    for part, joints in positions.items():
-                        if isinstance(joints, dict):
-                            print(f"\n{part.upper()}:")
-                            for joint_name, position in joints.items():
-                                print(f"  {joint_name}: {position:.3f} rad")
-                
-                elif choice == '3':
-                    print("\nMoving to neutral position...")
-                    if controller.move_to_neutral_position():
-                        print("[SUCCESS] Robot moved to neutral position")
-                    else:
-                        print("[FAILED] Failed to move to neutral position")
-                
-                elif choice == '4':
-                    print("\nPerforming wave gesture with right arm...")
-                    print("Turning on right arm...")
-                    controller.reachy.r_arm.turn_on()
-                    if controller.wave_hello("r_arm"):
-                        print("[SUCCESS] Wave gesture completed")
-                    else:
-                        print("[FAILED] Wave gesture failed")
-                
-                elif choice == '5':
-                    print("\nPerforming wave gesture with left arm...")
-                    print("Turning on left arm...")
-                    controller.reachy.l_arm.turn_on()
-                    if controller.wave_hello("l_arm"):
-                        print("[SUCCESS] Wave gesture completed")
-                    else:
-                        print("[FAILED] Wave gesture failed")
-                
-                elif choice == '6':
-                    move_specific_joint(controller)
-                
-                elif choice == '7':
-                    demo_head_movement(controller)
-                
-                elif choice == '8':
-                    demo_head_look_at(controller)
-                
-                elif choice == '9':
-                    demo_head_goto_joint(controller)
-                
-                elif choice == '10':
-                    demo_head_rotate_by(controller)
-                
-                elif choice == '11':
-                    demo_antenna_control(controller)
-                
-                elif choice == '12':
-                    read_head_position(controller)
-                
-                elif choice == '13':
-                    demo_gripper_control(controller)
-                
-                elif choice == '14':
-                    demo_arm_cartesian(controller)
-                
-                elif choice == '15':
-                    demo_arm_kinematics(controller)
-                
-                elif choice == '16':
-                    demo_audio_system(controller)
-                
-                elif choice == '17':
-                    demo_audio_recording(controller)
-                
-                elif choice == '18':
-                    demo_audio_management(controller)
-                
-                elif choice == '19':
-                    demo_intro_setup(controller)
-                
-                elif choice == '20':
-                    demo_reset_position(controller)
-                
-                elif choice == '21':
-                    demo_scene_manager(controller)
-                
-                elif choice == '22':
-                    demo_gazebo_scene_manager(controller)
-                
-                elif choice == '23':
-                    demo_object_interaction(controller)
-                
-                elif choice == '24':
-                    demo_mime_performance(controller)
+                choice = input("Enter your choice (0-25): ").strip()
                 
-                elif choice == '25':
+                if choice == '25':
                     print("\nExiting demo...")
                     break
                 
+                action = _ACTIONS.get(choice)
+                if action:
+                    action(controller)
                 else:
-                    print("Invalid choice. Please enter 1-25.")
+                    print("Invalid choice. Please enter 0-25.")
                     
             except KeyboardInterrupt:
                 print("\n\nExiting demo...")
@@ -974,8 +1090,9 @@ def main():
     except Exception as e:
         print(f"❌ Demo error: {e}")
     finally:
-        # Turn off robot smoothly before disconnecting
-        if controller.connected and controller.reachy:
+        # Turn off robot smoothly before disconnecting. turn_off_smoothly always
+        # waits out its 3 s torque ramp, so skip it when every part is already off
+        if controller.connected and controller.reachy and not controller.reachy.is_off():
             print("Turning off robot...")
             controller.reachy.turn_off_smoothly()
         controller.disconnect()
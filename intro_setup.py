@@ -5,10 +5,6 @@ Performs the intro sequence: head down -> turn on -> head up
 """
 
 import argparse
-import logging
-from main import ReachyController
-
-logging.basicConfig(level=logging.INFO)
 
 def main():
     """Standalone intro setup"""
@@ -21,6 +17,9 @@ def main():
     
     args = parser.parse_args()
     
+    # Imported here so --help and argument errors don't load the SDK
+    from main import ReachyController
+    
     print("🤖 Reachy2 Intro Setup")
     print("=" * 30)
     
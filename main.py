@@ -7,7 +7,10 @@ Main entry point for controlling Reachy2 robot through SDK
 import time
 import logging
 import math
-from typing import Optional, Dict, Tuple
+import functools
+from collections import defaultdict, deque
+import numpy as np
+from typing import Optional, Dict, Tuple, Sequence
 from reachy2_sdk.reachy_sdk import ReachySDK
 
 logging.basicConfig(level=logging.INFO)
@@ -44,22 +47,109 @@ JOINT_LIMITS = {
     }
 }
 
+# JOINT_LIMITS keyed by (part, joint) for single-lookup validation
+FLAT_JOINT_LIMITS = {
+    (part, joint): limits
+    for part, joints in JOINT_LIMITS.items()
+    for joint, limits in joints.items()
+}
+
+# How long (seconds) a read_joint_positions() result may be reused
+JOINT_CACHE_TTL = 0.5
+
+# How long (seconds) a get_audio_files() listing may be reused; matches AudioManager
+AUDIO_FILES_TTL = 2.0
+
+# read_joint_positions() keys for each robot part name
+PART_STATE_KEYS = {
+    'r_arm': 'right_arm',
+    'l_arm': 'left_arm',
+    'head': 'head'
+}
+
+# Joint order expected by arm.goto() joint-space targets
+ARM_JOINT_ORDER = (
+    'shoulder.pitch',
+    'shoulder.roll',
+    'elbow.yaw',
+    'elbow.pitch',
+    'wrist.roll',
+    'wrist.pitch',
+    'wrist.yaw'
+)
+
+# Wave gesture keyframes: (joint targets in radians, duration in seconds)
+WAVE_KEYFRAMES = (
+    ({'shoulder.pitch': -0.5, 'elbow.pitch': -1.2}, 1.0),                   # Raise arm, bend elbow
+    ({'wrist.yaw': 0.5}, 0.5),                                              # Wave right
+    ({'wrist.yaw': -0.5}, 0.5),                                             # Wave left
+    ({'wrist.yaw': 0.5}, 0.5),                                              # Wave right
+    ({'wrist.yaw': 0.0, 'elbow.pitch': 0.0, 'shoulder.pitch': 0.0}, 1.0),   # Return to rest
+)
+
+# Intro sequence movement duration (seconds) for each speed setting
+INTRO_SPEED_DURATIONS = {
+    "slow": 3.0,
+    "medium": 2.0,
+    "fast": 1.0
+}
+
+# Number of latency samples kept per instrumented method
+LATENCY_SAMPLES = 4096
+
+
+def _timed(method):
+    """Record the wall-clock duration of every call to a controller method"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        t0 = time.perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._latencies[method.__name__].append(time.perf_counter_ns() - t0)
+    return wrapper
+
 
 class ReachyController:
     """Main controller class for Reachy2 robot operations"""
     
-    def __init__(self, host: str = "localhost", port: int = 50055):
+    __slots__ = (
+        'host',
+        'port',
+        'latency_warning_threshold_ms',
+        'reachy',
+        'connected',
+        '_joint_cache',
+        '_joint_cache_time',
+        '_audio_files',
+        '_audio_files_time',
+        '_joint_handles',
+        '_parts',
+        '_latencies'
+    )
+    
+    def __init__(self, host: str = "localhost", port: int = 50055,
+                 latency_warning_threshold_ms: Optional[float] = None):
         """
         Initialize connection to Reachy2 robot
         
         Args:
             host: Robot IP address or hostname
             port: Connection port
+            latency_warning_threshold_ms: Warn when a method's p99 latency exceeds this
         """
         self.host = host
         self.port = port
+        self.latency_warning_threshold_ms = latency_warning_threshold_ms
         self.reachy: Optional[ReachySDK] = None
         self.connected = False
+        self._joint_cache: Optional[dict] = None
+        self._joint_cache_time = 0.0
+        self._audio_files: Optional[list] = None
+        self._audio_files_time = 0.0
+        self._joint_handles: Dict[Tuple[str, str], object] = {}
+        self._parts: Tuple[Tuple[str, object], ...] = ()
+        self._latencies: Dict[str, deque] = defaultdict(lambda: deque(maxlen=LATENCY_SAMPLES))
     
     def connect(self) -> bool:
         """
@@ -73,7 +163,6 @@ class ReachyController:
             self.reachy = ReachySDK(host=self.host)
             
             # Test connection with timeout
-            import time
             logger.info("Testing connection...")
             time.sleep(2)
             
@@ -81,17 +170,32 @@ class ReachyController:
             try:
                 info = self.reachy.info
                 logger.info(f"Robot info: {info}")
+                self._index_joints()
                 self.connected = True
                 logger.info("Successfully connected to Reachy2")
                 return True
             except Exception as conn_test_error:
                 logger.error(f"Connection test failed: {conn_test_error}")
+                self._joint_handles = {}
+                self._parts = ()
                 return False
         except Exception as e:
             logger.error(f"Failed to connect to Reachy2: {e}")
             self.connected = False
             return False
     
+    def _index_joints(self):
+        """Record the available parts and cache every joint handle by (part, joint name)"""
+        self._parts = tuple(
+            (part, getattr(self.reachy, part))
+            for part in PART_STATE_KEYS
+            if getattr(self.reachy, part, None) is not None
+        )
+        self._joint_handles = {}
+        for part, robot_part in self._parts:
+            for joint_name, joint in robot_part.joints.items():
+                self._joint_handles[(part, joint_name)] = joint
+    
     def perform_intro_setup(self, speed: str = "medium") -> bool:
         """
         Perform intro setup sequence: head down -> turn on -> head up
@@ -108,14 +212,10 @@ class ReachyController:
         
         try:
             logger.info("Starting Reachy2 intro setup sequence...")
+            self._joint_cache = None
             
             # Set movement durations based on speed
-            duration_map = {
-                "slow": 3.0,
-                "medium": 2.0, 
-                "fast": 1.0
-            }
-            move_duration = duration_map.get(speed, 2.0)
+            move_duration = INTRO_SPEED_DURATIONS.get(speed, 2.0)
             
             # Step 1: Turn on head only (for initial positioning)
             logger.info("Turning on head for positioning...")
@@ -140,15 +240,15 @@ class ReachyController:
             
             # Step 5: Optional antenna greeting
             logger.info("Adding personality with antenna movement...")
-            # Subtle antenna movement for personality
-            self.reachy.head.l_antenna.goto(10, duration=0.8)
-            self.reachy.head.r_antenna.goto(-10, duration=0.8) 
-            time.sleep(1)
+            # Subtle antenna movement for personality; each antenna queues its own
+            # gotos, so both phases are sent up front and play back to back
+            l_antenna, r_antenna = self.reachy.head.l_antenna, self.reachy.head.r_antenna
+            l_antenna.goto(10, duration=0.8)
+            r_antenna.goto(-10, duration=0.8)
             
             # Return antennas to neutral
-            self.reachy.head.l_antenna.goto(0, duration=0.8)
-            self.reachy.head.r_antenna.goto(0, duration=0.8)
-            time.sleep(1)
+            goto_ids = [l_antenna.goto(0, duration=0.8), r_antenna.goto(0, duration=0.8)]
+            self.wait_for_gotos(goto_ids, timeout=3.6)
             
             logger.info("✨ Intro setup sequence completed successfully!")
             print("\n🤖 Hello! Reachy2 is ready for action!")
@@ -171,6 +271,7 @@ class ReachyController:
             
         try:
             logger.info("Resetting to head-down position...")
+            self._joint_cache = None
             
             # Turn on head if not already on
             if not self.reachy.head.is_on():
@@ -195,6 +296,8 @@ class ReachyController:
         if self.reachy and self.connected:
             self.reachy.disconnect()
             self.connected = False
+            self._joint_handles = {}
+            self._parts = ()
             logger.info("Disconnected from Reachy2")
     
     def get_robot_info(self) -> dict:
@@ -211,73 +314,150 @@ class ReachyController:
             info = {
                 "connected": self.connected,
                 "host": self.host,
-                "available_parts": [],
+                "available_parts": [PART_STATE_KEYS[part] for part, _ in self._parts],
                 "joint_states": {}
             }
             
-            # Get available parts
-            if hasattr(self.reachy, 'r_arm'):
-                info["available_parts"].append("right_arm")
-            if hasattr(self.reachy, 'l_arm'):
-                info["available_parts"].append("left_arm")
-            if hasattr(self.reachy, 'head'):
-                info["available_parts"].append("head")
-            
             return info
             
         except Exception as e:
             logger.error(f"Error getting robot info: {e}")
             return {"error": str(e)}
     
-    def read_joint_positions(self) -> dict:
+    @_timed
+    def read_joint_positions(self, max_age: float = JOINT_CACHE_TTL) -> dict:
         """
         Read current joint positions from all available parts
         
+        Args:
+            max_age: Reuse the previous reading if it is younger than this many seconds
+            
         Returns:
-            dict: Joint positions by part
+            dict: Joint positions by part; a copy the caller is free to modify
         """
         if not self.connected or not self.reachy:
             return {"error": "Not connected to robot"}
         
+        if self._joint_cache is not None and time.monotonic() - self._joint_cache_time < max_age:
+            return self._copy_positions(self._joint_cache)
+        
         try:
             positions = {}
             
-            # Read right arm joints if available
-            if hasattr(self.reachy, 'r_arm'):
-                positions['right_arm'] = {}
+            # One snapshot per part from the SDK's locally streamed joint state
+            for part, robot_part in self._parts:
+                key = PART_STATE_KEYS[part]
                 try:
-                    # Get all joints from the right arm
-                    for joint_name, joint in self.reachy.r_arm.joints.items():
-                        positions['right_arm'][joint_name] = joint.present_position
+                    positions[key] = {name: joint.present_position for name, joint in robot_part.joints.items()}
                 except Exception as e:
-                    positions['right_arm'] = {"error": str(e)}
+                    positions[key] = {"error": str(e)}
             
-            # Read left arm joints if available
-            if hasattr(self.reachy, 'l_arm'):
-                positions['left_arm'] = {}
-                try:
-                    # Get all joints from the left arm
-                    for joint_name, joint in self.reachy.l_arm.joints.items():
-                        positions['left_arm'][joint_name] = joint.present_position
-                except Exception as e:
-                    positions['left_arm'] = {"error": str(e)}
-            
-            # Read head joints if available
-            if hasattr(self.reachy, 'head'):
-                positions['head'] = {}
-                try:
-                    # Get all joints from the head
-                    for joint_name, joint in self.reachy.head.joints.items():
-                        positions['head'][joint_name] = joint.present_position
-                except Exception as e:
-                    positions['head'] = {"error": str(e)}
-            
-            return positions
+            self._joint_cache = positions
+            self._joint_cache_time = time.monotonic()
+            return self._copy_positions(positions)
             
         except Exception as e:
             logger.error(f"Error reading joint positions: {e}")
             return {"error": str(e)}
     
+    @staticmethod
+    def _copy_positions(positions: dict) -> dict:
+        """Copy a joint-position snapshot so callers cannot modify the cached one"""
+        return {key: dict(joints) for key, joints in positions.items()}
+    
+    def get_latency_stats(self) -> dict:
+        """
+        Summarize recorded call latencies of the instrumented methods
+        
+        Returns:
+            dict: Sample count and p50/p99/max latency in milliseconds by method name
+        """
+        stats = {}
+        for name, samples in self._latencies.items():
+            if not samples:
+                continue
+            latencies_ms = np.array(samples) / 1e6
+            p50, p99 = np.percentile(latencies_ms, [50, 99])
+            stats[name] = {
+                "count": len(latencies_ms),
+                "p50_ms": float(p50),
+                "p99_ms": float(p99),
+                "max_ms": float(latencies_ms.max())
+            }
+            
+            threshold = self.latency_warning_threshold_ms
+            if threshold is not None and p99 > threshold:
+                logger.warning(f"{name} p99 latency {p99:.1f} ms exceeds {threshold} ms")
+        return stats
+    
+    def refresh_state(self) -> dict:
+        """
+        Take a fresh joint-position snapshot, replacing the cached one
+        
+        Returns:
+            dict: Joint positions by part
+        """
+        return self.read_joint_positions(max_age=0)
+    
+    def get_part_positions(self, part: str) -> dict:
+        """
+        Get one part's joint positions from the current snapshot
+        
+        Args:
+            part: Robot part ('r_arm', 'l_arm', 'head')
+            
+        Returns:
+            dict: Joint positions by joint name, empty if unavailable
+        """
+        joints = self.read_joint_positions().get(PART_STATE_KEYS.get(part, part))
+        if not isinstance(joints, dict) or "error" in joints:
+            return {}
+        return joints
+    
+    def ensure_on(self, part: str) -> bool:
+        """
+        Turn on a robot part unless it is already on
+        
+        is_on() reads the state the SDK streams locally, so checking it is
+        free while turn_on() is a request to the robot.
+        
+        Args:
+            part: Robot part ('r_arm', 'l_arm', 'head')
+            
+        Returns:
+            bool: True if turn_on() was sent
+        """
+        robot_part = getattr(self.reachy, part)
+        if robot_part.is_on():
+            return False
+        robot_part.turn_on()
+        return True
+    
+    def get_audio_files(self, force_refresh: bool = False) -> list:
+        """
+        List the audio files stored on the robot
+        
+        The listing is reused for AUDIO_FILES_TTL seconds, or until
+        invalidate_audio_files() is called, so changes made through other
+        paths (e.g. AudioManager) show up shortly after.
+        
+        Args:
+            force_refresh: If True, query the robot even if a listing is cached
+            
+        Returns:
+            list: Audio filenames
+        """
+        if (force_refresh or self._audio_files is None
+                or time.monotonic() - self._audio_files_time >= AUDIO_FILES_TTL):
+            files = self.reachy.audio.get_audio_files()
+            self._audio_files = list(files) if files else []
+            self._audio_files_time = time.monotonic()
+        return list(self._audio_files)
+    
+    def invalidate_audio_files(self):
+        """Drop the cached audio file listing"""
+        self._audio_files = None
+    
     def validate_joint_position(self, part: str, joint_name: str, position: float) -> bool:
         """
         Validate that a joint position is within safety limits
@@ -290,22 +470,47 @@ class ReachyController:
         Returns:
             bool: True if position is safe
         """
-        if part not in JOINT_LIMITS:
-            logger.warning(f"No safety limits defined for part '{part}'")
-            return True
-        
-        if joint_name not in JOINT_LIMITS[part]:
+        limits = FLAT_JOINT_LIMITS.get((part, joint_name))
+        if limits is None:
             logger.warning(f"No safety limits defined for joint '{part}.{joint_name}'")
             return True
         
-        min_pos, max_pos = JOINT_LIMITS[part][joint_name]
+        min_pos, max_pos = limits
         
-        if position < min_pos or position > max_pos:
+        if not min_pos <= position <= max_pos:
             logger.error(f"Position {position:.3f} for {part}.{joint_name} exceeds safety limits [{min_pos:.3f}, {max_pos:.3f}]")
             return False
         
         return True
     
+    def validate_trajectory(self, part: str, joint_names: Sequence[str], positions) -> np.ndarray:
+        """
+        Validate every sample of a multi-joint trajectory against the safety limits
+        
+        Args:
+            part: Robot part name
+            joint_names: Joint name for each column of positions
+            positions: Array of shape (samples, len(joint_names)), in radians
+            
+        Returns:
+            np.ndarray: Boolean mask, True for samples where every joint is within limits
+        """
+        positions = np.asarray(positions, dtype=float)
+        mins = np.full(len(joint_names), -np.inf)
+        maxs = np.full(len(joint_names), np.inf)
+        for i, joint_name in enumerate(joint_names):
+            limits = FLAT_JOINT_LIMITS.get((part, joint_name))
+            if limits is None:
+                logger.warning(f"No safety limits defined for joint '{part}.{joint_name}'")
+                continue
+            mins[i], maxs[i] = limits
+        
+        valid = np.all((positions >= mins) & (positions <= maxs), axis=1)
+        if not valid.all():
+            logger.error(f"{np.count_nonzero(~valid)} of {len(valid)} samples for {part} exceed safety limits")
+        return valid
+    
+    @_timed
     def move_joint(self, part: str, joint_name: str, position: float, duration: float = 2.0) -> bool:
         """
         Move a specific joint to target position
@@ -328,25 +533,16 @@ class ReachyController:
             if not self.validate_joint_position(part, joint_name, position):
                 return False
             
-            # Get the robot part
-            robot_part = getattr(self.reachy, part, None)
-            if robot_part is None:
-                logger.error(f"Robot part '{part}' not available")
-                return False
-            
             # Get the joint
-            if joint_name not in robot_part.joints:
+            joint = self._joint_handles.get((part, joint_name))
+            if joint is None:
                 logger.error(f"Joint '{joint_name}' not found in {part}")
                 return False
             
-            joint = robot_part.joints[joint_name]
-            
-            # Set target position
-            joint.goal_position = position
-            logger.info(f"Moving {part}.{joint_name} to {position:.3f} rad over {duration}s")
-            
-            # Wait for movement to complete
-            time.sleep(duration)
+            # Send the move and block until the SDK reports it finished
+            self._joint_cache = None
+            logger.info("Moving %s.%s to %.3f rad over %ss", part, joint_name, position, duration)
+            joint.goto(position, duration=duration, wait=True, degrees=False)
             
             return True
             
@@ -354,6 +550,7 @@ class ReachyController:
             logger.error(f"Error moving joint {part}.{joint_name}: {e}")
             return False
     
+    @_timed
     def move_to_neutral_position(self, duration: float = 3.0) -> bool:
         """
         Move robot to neutral/home position
@@ -370,23 +567,23 @@ class ReachyController:
         
         try:
             logger.info("Moving robot to neutral position")
+            self._joint_cache = None
             
-            # Move arms to neutral position
-            if hasattr(self.reachy, 'r_arm'):
-                for joint_name, joint in self.reachy.r_arm.joints.items():
-                    joint.goal_position = 0.0
-            
-            if hasattr(self.reachy, 'l_arm'):
-                for joint_name, joint in self.reachy.l_arm.joints.items():
-                    joint.goal_position = 0.0
+            # Each part plays its own goto, so start them all before waiting
+            goto_ids = []
             
-            # Move head to neutral position
-            if hasattr(self.reachy, 'head'):
-                for joint_name, joint in self.reachy.head.joints.items():
-                    joint.goal_position = 0.0
+            for part, robot_part in self._parts:
+                if part == 'head':
+                    # Move head to neutral position
+                    goto_ids.append(robot_part.goto([0.0, 0.0, 0.0], duration=duration))
+                    goto_ids.append(robot_part.l_antenna.goto(0.0, duration=duration))
+                    goto_ids.append(robot_part.r_antenna.goto(0.0, duration=duration))
+                else:
+                    # Move arms to neutral position
+                    goto_ids.append(robot_part.goto([0.0] * 7, duration=duration))
             
             # Wait for movement to complete
-            time.sleep(duration)
+            self.wait_for_gotos(goto_ids, timeout=duration + 2.0)
             
             logger.info("Robot moved to neutral position")
             return True
@@ -395,6 +592,31 @@ class ReachyController:
             logger.error(f"Error moving to neutral position: {e}")
             return False
     
+    def wait_for_gotos(self, goto_ids: list, timeout: float, poll_interval: float = 0.05) -> bool:
+        """
+        Wait until every goto in a list has finished
+        
+        Args:
+            goto_ids: GoToIds returned by non-blocking goto calls
+            timeout: Maximum time to wait in seconds
+            poll_interval: Delay between status checks in seconds
+            
+        Returns:
+            bool: True if all gotos finished before the timeout
+        """
+        # An id of -1 means the SDK refused the command (e.g. part is off)
+        pending = [goto_id for goto_id in goto_ids if goto_id.id != -1]
+        deadline = time.monotonic() + timeout
+        while pending:
+            pending = [goto_id for goto_id in pending if not self.reachy.is_goto_finished(goto_id)]
+            if not pending:
+                break
+            if time.monotonic() >= deadline:
+                logger.warning(f"{len(pending)} movement(s) still running after {timeout}s")
+                return False
+            time.sleep(poll_interval)
+        return True
+    
     def wave_hello(self, arm: str = "r_arm") -> bool:
         """
         Perform a simple wave gesture
@@ -418,22 +640,27 @@ class ReachyController:
                 logger.error(f"Arm '{arm}' not available")
                 return False
             
-            # Wave sequence
-            movements = [
-                ("shoulder.pitch", -0.5, 1.0),  # Raise arm
-                ("elbow.pitch", -1.2, 1.0),    # Bend elbow
-                ("wrist.yaw", 0.5, 0.5),       # Wave right
-                ("wrist.yaw", -0.5, 0.5),      # Wave left
-                ("wrist.yaw", 0.5, 0.5),       # Wave right
-                ("wrist.yaw", 0.0, 0.5),       # Center wrist
-                ("elbow.pitch", 0.0, 1.0),     # Straighten elbow
-                ("shoulder.pitch", 0.0, 1.0),  # Lower arm
-            ]
-            
-            for joint_name, position, duration in movements:
-                if joint_name in robot_arm.joints:
-                    robot_arm.joints[joint_name].goal_position = position
-                    time.sleep(duration)
+            self._joint_cache = None
+            
+            # Build full-arm keyframes starting from the current (streamed) pose so
+            # every joint in a keyframe moves together along one minimum-jerk goto
+            pose = np.radians([self._joint_handles[(arm, name)].present_position for name in ARM_JOINT_ORDER])
+            keyframes = []
+            for targets, duration in WAVE_KEYFRAMES:
+                pose = pose.copy()
+                for joint_name, position in targets.items():
+                    pose[ARM_JOINT_ORDER.index(joint_name)] = position
+                keyframes.append((pose, duration))
+            
+            # Check every keyframe against the safety limits before sending any of them
+            if not self.validate_trajectory(arm, ARM_JOINT_ORDER, [pose for pose, _ in keyframes]).all():
+                return False
+            
+            # Arm gotos are queued and played back to back, so send the whole
+            # gesture at once and only block on the last keyframe
+            for i, (pose, duration) in enumerate(keyframes):
+                robot_arm.goto(pose.tolist(), duration=duration, wait=(i == len(keyframes) - 1),
+                               interpolation_mode="minimum_jerk", degrees=False)
             
             logger.info("Wave gesture completed")
             return True
@@ -7,7 +7,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from gazebo_scene_manager import GazeboSceneManager
+from gazebo_scene_manager import GazeboSceneManager, SceneObject
 
 def test_simple_spawn():
     """Test spawning a single simple object"""
@@ -25,15 +25,16 @@ def test_simple_spawn():
     # Test spawning a simple red box
     print("\nSpawning a simple red box...")
     
-    simple_object = {
-        "name": "test_red_box",
-        "type": "box",
-        "position": (0.5, 0.0, 1.0),  # 1m high so it's visible
-        "size": (0.2, 0.2, 0.2),      # 20cm cube
-        "color": "red"
-    }
+    simple_object = SceneObject(
+        name="test_red_box",
+        type="box",
+        position=(0.5, 0.0, 1.0),  # 1m high so it's visible
+        size=(0.2, 0.2, 0.2),      # 20cm cube
+        color="red"
+    )
     
-    if scene_manager._spawn_object_in_gazebo(simple_object):
+    entry = GazeboSceneManager._sdf_entry(simple_object)
+    if scene_manager._spawn_batch([entry])[simple_object.name]:
         print("[SUCCESS] Red box spawned in Gazebo!")
         print("Check your Gazebo window - you should see a red cube!")
         